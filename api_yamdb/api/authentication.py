@@ -0,0 +1,151 @@
+import copy
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import AccessToken
+
+User = get_user_model()
+
+CLAIMS_KEY = 'api:token-claims:{user_id}'
+TOKEN_CLAIMS = ('username', 'role', 'is_superuser')
+
+
+def token_claims(user):
+    return {claim: getattr(user, claim) for claim in TOKEN_CLAIMS}
+
+
+def access_token_for(user):
+    """Токен доступа; в режиме JWT_STATELESS с ролью пользователя."""
+    token = AccessToken.for_user(user)
+    if settings.JWT_STATELESS and user.is_active:
+        token.payload.update(token_claims(user))
+        remember_token_claims(user.pk, token_claims(user))
+    return token
+
+
+def remember_token_claims(user_id, claims):
+    """Кэширует актуальные данные пользователя для сверки с токенами.
+
+    Пустой словарь означает, что пользователь удалён или неактивен.
+    """
+    cache.set(
+        CLAIMS_KEY.format(user_id=user_id),
+        claims,
+        settings.JWT_CLAIMS_CACHE_TTL,
+    )
+
+
+def current_token_claims(user_id):
+    """Данные пользователя для сверки с токеном: из кэша, иначе из БД.
+
+    Запись в кэше может быть вытеснена, поэтому её отсутствие не делает
+    токен действительным: данные перечитываются из таблицы пользователей.
+    """
+    claims = cache.get(CLAIMS_KEY.format(user_id=user_id))
+    if claims is None:
+        claims = (
+            User.objects.filter(pk=user_id, is_active=True)
+            .values(*TOKEN_CLAIMS)
+            .first()
+        ) or {}
+        remember_token_claims(user_id, claims)
+    return claims
+
+
+class UserCache:
+    """LRU-кэш пользователей процесса с ограниченным временем жизни.
+
+    Сигналы сбрасывают запись только в том процессе, где пользователь
+    изменён, поэтому в остальных она живёт не дольше USER_CACHE_TTL.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.clear()
+
+    def clear(self):
+        with self.lock:
+            self.entries = OrderedDict()
+            self.hits = 0
+            self.misses = 0
+
+    def get(self, user_id):
+        with self.lock:
+            entry = self.entries.get(user_id)
+            if entry is None or entry[0] < time.monotonic():
+                self.entries.pop(user_id, None)
+                self.misses += 1
+                return None
+            self.entries.move_to_end(user_id)
+            self.hits += 1
+            return copy.copy(entry[1])
+
+    def set(self, user):
+        if settings.USER_CACHE_SIZE <= 0:
+            return
+        with self.lock:
+            self.entries[user.pk] = (
+                time.monotonic() + settings.USER_CACHE_TTL,
+                copy.copy(user),
+            )
+            self.entries.move_to_end(user.pk)
+            while len(self.entries) > settings.USER_CACHE_SIZE:
+                self.entries.popitem(last=False)
+
+    def invalidate(self, user_id):
+        with self.lock:
+            self.entries.pop(user_id, None)
+
+    def stats(self):
+        with self.lock:
+            requests = self.hits + self.misses
+            return {
+                'size': len(self.entries),
+                'max_size': settings.USER_CACHE_SIZE,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / requests if requests else None,
+            }
+
+
+user_cache = UserCache()
+
+
+class ClaimsJWTAuthentication(JWTAuthentication):
+    """JWT-аутентификация, которая берёт роль из токена без запроса к БД.
+
+    Пользователь собирается из утверждений токена и годится для проверки
+    прав и присвоения автора, но не для сохранения: у него нет остальных
+    полей. Утверждения сверяются с current_token_claims, которая идёт в
+    БД только при промахе кэша. Пользователей для токенов без роли отдаёт
+    user_cache, а при промахе - таблица пользователей.
+    """
+
+    def get_user(self, validated_token):
+        if not settings.JWT_STATELESS or 'role' not in validated_token:
+            user = user_cache.get(
+                validated_token.get(api_settings.USER_ID_CLAIM)
+            )
+            if user is None:
+                user = super().get_user(validated_token)
+                user_cache.set(user)
+            return user
+        user = User(
+            pk=validated_token[api_settings.USER_ID_CLAIM],
+            **{claim: validated_token[claim] for claim in TOKEN_CLAIMS},
+        )
+        user._state.adding = False
+        user.from_token = True
+        if current_token_claims(user.pk) != token_claims(user):
+            raise AuthenticationFailed(
+                'Данные пользователя изменились, получите новый токен.',
+                code='token_claims_changed',
+            )
+        return user
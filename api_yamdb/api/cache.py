@@ -0,0 +1,97 @@
+import hashlib
+import time
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework.settings import api_settings
+
+VERSION_KEY = 'api:version:{label}'
+RESPONSE_KEY = 'api:response:{label}:{version}:{format}:{url}'
+
+
+def get_model_version(model):
+    """Текущая версия таблицы; новая версия начинается с метки времени.
+
+    Версия живёт не дольше ответов: с кэшем в памяти процесса так другие
+    процессы узнают об изменениях не позже API_RESPONSE_CACHE_TIMEOUT.
+    """
+    return cache.get_or_set(
+        VERSION_KEY.format(label=model._meta.label_lower),
+        time.time_ns,
+        settings.API_RESPONSE_CACHE_TIMEOUT,
+    )
+
+
+def bump_model_version(model):
+    key = VERSION_KEY.format(label=model._meta.label_lower)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, time.time_ns(), settings.API_RESPONSE_CACHE_TIMEOUT)
+
+
+def versions_etag(*models):
+    """ETag из версий таблиц, от которых зависит ответ, без запросов к БД."""
+
+    def etag_func(request, *args, **kwargs):
+        versions = '.'.join(str(get_model_version(model)) for model in models)
+        source = '|'.join((
+            versions,
+            request.get_full_path(),
+            request.META.get('HTTP_ACCEPT', ''),
+        ))
+        return 'W/"{}"'.format(hashlib.md5(source.encode()).hexdigest())
+
+    return etag_func
+
+
+class VersionedListCacheMixin:
+    """Кэширует ответы list() до первого изменения модели queryset.
+
+    В ключ попадают только параметры поиска и пагинации, от которых
+    зависит ответ. Запросы с другими параметрами отдаются без кэша, чтобы
+    не плодить записи и не хранить чужие параметры в ссылках next.
+    """
+
+    def get_list_cache_params(self):
+        params = [
+            getattr(backend, 'search_param', None)
+            for backend in self.filter_backends
+        ]
+        if self.paginator is not None:
+            params.extend((
+                getattr(self.paginator, 'page_query_param', None),
+                getattr(self.paginator, 'page_size_query_param', None),
+            ))
+        return [param for param in params if param]
+
+    def get_list_cache_key(self, request):
+        model = self.queryset.model
+        query = urlencode([
+            (param, request.query_params[param])
+            for param in self.get_list_cache_params()
+            if param in request.query_params
+        ])
+        return RESPONSE_KEY.format(
+            label=model._meta.label_lower,
+            version=get_model_version(model),
+            format=request.accepted_renderer.format,
+            url=f'{request.build_absolute_uri(request.path)}?{query}',
+        )
+
+    def list(self, request, *args, **kwargs):
+        params = set(self.get_list_cache_params())
+        params.add(api_settings.URL_FORMAT_OVERRIDE)
+        if not set(request.query_params) <= params:
+            return super().list(request, *args, **kwargs)
+        key = self.get_list_cache_key(request)
+        response = cache.get(key)
+        if response is None:
+            response = super().list(request, *args, **kwargs)
+            response.add_post_render_callback(
+                lambda rendered: cache.set(
+                    key, rendered, settings.API_RESPONSE_CACHE_TIMEOUT
+                )
+            )
+        return response
@@ -1,4 +1,5 @@
 from django_filters.rest_framework import CharFilter, FilterSet
+from rest_framework.filters import OrderingFilter
 
 from reviews.models import Title
 
@@ -7,7 +8,22 @@ class TitlesFilter(FilterSet):
     name = CharFilter(field_name='name', lookup_expr='contains')
     category = CharFilter(field_name='category__slug', lookup_expr='contains')
     genre = CharFilter(field_name='genre__slug', lookup_expr='contains')
+    search = CharFilter(method='filter_search')
 
     class Meta:
         model = Title
-        fields = ('name', 'category', 'genre', 'year')
+        fields = ('name', 'category', 'genre', 'year', 'search')
+
+    def filter_search(self, queryset, name, value):
+        return queryset.search(value)
+
+
+class TitleOrderingFilter(OrderingFilter):
+    """Дополняет сортировку полем id, как в составных индексах Title."""
+
+    def get_ordering(self, request, queryset, view):
+        ordering = super().get_ordering(request, queryset, view)
+        if not ordering or {'id', '-id'} & set(ordering):
+            return ordering
+        tiebreaker = '-id' if ordering[-1].startswith('-') else 'id'
+        return (*ordering, tiebreaker)
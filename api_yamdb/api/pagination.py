@@ -0,0 +1,196 @@
+import json
+
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import connection
+from django.db.models import BooleanField
+from django.db.models.expressions import RawSQL
+from rest_framework.exceptions import NotFound, ValidationError
+from rest_framework.pagination import CursorPagination
+
+MIN_INT = -2 ** 63
+MAX_INT = 2 ** 63 - 1
+
+
+def reject_constant(name):
+    """NaN и Infinity не бывают значениями позиции."""
+    raise ValueError(name)
+
+
+class TitleCursorPagination(CursorPagination):
+    """Курсор по полю сортировки произведений и id, а не по одному полю.
+
+    CursorPagination фильтрует только по первому полю и при повторах
+    добавляет OFFSET, а rating у произведений без отзывов пуст. Здесь
+    позиция - JSON с парой (поле, id), страница читается диапазоном
+    (поле, id) < (значение, id) по составному индексу, а пустые значения
+    поля - отдельным диапазоном по тому же индексу. NULL считается меньше
+    любого значения на всех СУБД.
+    """
+
+    ordering = ('-id',)
+
+    def get_ordering(self, request, queryset, view):
+        ordering = None
+        for backend in getattr(view, 'filter_backends', ()):
+            if hasattr(backend, 'get_ordering'):
+                ordering = backend().get_ordering(request, queryset, view)
+                break
+        if not ordering and 'search_rank' in queryset.query.order_by:
+            # Ранг bm25 вычисляется на лету, и по нему нет индекса.
+            raise ValidationError({
+                'pagination': 'Результаты поиска упорядочены по '
+                              'релевантности и не листаются курсором: '
+                              'укажите ordering или уберите '
+                              'pagination=cursor.'
+            })
+        ordering = tuple(ordering or self.ordering)
+        field = ordering[0]
+        tiebreaker = '-id' if field.startswith('-') else 'id'
+        if ordering not in ((field,), (field, tiebreaker)) or (
+            len(ordering) == 1 and field.lstrip('-') != 'id'
+        ):
+            raise ValidationError({
+                'ordering': 'Курсорная пагинация поддерживает сортировку '
+                            'только по одному полю.'
+            })
+        return ordering
+
+    def segments(self, queryset, position, reverse):
+        """Диапазоны строк после позиции в порядке выдачи.
+
+        Каждый диапазон - отдельный запрос, который СУБД выполняет поиском
+        по индексу (поле, id) без OR и без сортировки во временной таблице.
+        """
+        field = self.ordering[0]
+        descending = field.startswith('-') != reverse
+        name = field.lstrip('-')
+        operator = '<' if descending else '>'
+        direction = '-' if descending else ''
+        if name == 'id':
+            if position is not None:
+                queryset = queryset.filter(
+                    **{'id__lt' if descending else 'id__gt': position[0]}
+                )
+            return [queryset.order_by(f'{direction}id')]
+
+        filled = queryset.order_by(f'{direction}{name}', f'{direction}id')
+        if position is not None and position[0] is not None:
+            filled = filled.filter(
+                self.row_after(queryset.model, name, operator, position)
+            )
+        if not queryset.model._meta.get_field(name).null:
+            return [filled]
+        filled = filled.filter(**{f'{name}__isnull': False})
+        empty = queryset.filter(**{f'{name}__isnull': True}).order_by(
+            f'{direction}id'
+        )
+        if position is None:
+            return [filled, empty] if descending else [empty, filled]
+        if position[0] is not None:
+            return [filled, empty] if descending else [filled]
+        empty = empty.filter(
+            **{'id__lt' if descending else 'id__gt': position[1]}
+        )
+        return [empty] if descending else [empty, filled]
+
+    @staticmethod
+    def row_after(model, name, operator, position):
+        """(поле, id) < (значение, id): сравнение строк ищется по индексу."""
+        quote = connection.ops.quote_name
+        table = quote(model._meta.db_table)
+        column = quote(model._meta.get_field(name).column)
+        return RawSQL(
+            f'({table}.{column}, {table}.{quote("id")}) {operator} (%s, %s)',
+            position,
+            output_field=BooleanField(),
+        )
+
+    def decode_position(self, model, position):
+        """Значения позиции из курсора, проверенные полями модели."""
+        try:
+            values = json.loads(position, parse_constant=reject_constant)
+            if not isinstance(values, list) or len(values) != len(
+                self.ordering
+            ):
+                raise ValueError
+            fields = [
+                model._meta.get_field(field.lstrip('-'))
+                for field in self.ordering
+            ]
+            if any(
+                isinstance(value, (list, dict))
+                or value is None and not field.null
+                or isinstance(value, int) and not MIN_INT <= value <= MAX_INT
+                for field, value in zip(fields, values)
+            ):
+                raise ValueError
+            return [
+                field.clean(value, None)
+                for field, value in zip(fields, values)
+            ]
+        except (
+            TypeError, ValueError, OverflowError, DjangoValidationError
+        ):
+            raise NotFound(self.invalid_cursor_message)
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+
+        self.base_url = request.build_absolute_uri()
+        self.ordering = self.get_ordering(request, queryset, view)
+        self.cursor = self.decode_cursor(request)
+        if self.cursor is None:
+            reverse, current_position = False, None
+        else:
+            _, reverse, current_position = self.cursor
+
+        results = []
+        position = (
+            None
+            if current_position is None
+            else self.decode_position(queryset.model, current_position)
+        )
+        for segment in self.segments(queryset, position, reverse):
+            results.extend(segment[:self.page_size + 1 - len(results)])
+            if len(results) > self.page_size:
+                break
+        self.page = results[:self.page_size]
+        following_position = (
+            self._get_position_from_instance(results[-1], self.ordering)
+            if len(results) > len(self.page)
+            else None
+        )
+
+        if reverse:
+            self.page.reverse()
+            self.has_next = current_position is not None
+            self.has_previous = following_position is not None
+            self.next_position = current_position
+            self.previous_position = following_position
+        else:
+            self.has_next = following_position is not None
+            self.has_previous = current_position is not None
+            self.next_position = following_position
+            self.previous_position = current_position
+
+        if (self.has_previous or self.has_next) and self.template is not None:
+            self.display_page_controls = True
+        return self.page
+
+    def _get_position_from_instance(self, instance, ordering):
+        return json.dumps([
+            instance[field.lstrip('-')]
+            if isinstance(instance, dict)
+            else getattr(instance, field.lstrip('-'))
+            for field in ordering
+        ])
+
+
+class ReviewCursorPagination(CursorPagination):
+    ordering = ('-pub_date', '-id')
+
+
+class CommentCursorPagination(CursorPagination):
+    ordering = ('-pub_date', '-id')
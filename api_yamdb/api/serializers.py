@@ -1,12 +1,15 @@
 import re
+from collections import defaultdict
 
+from django.db import IntegrityError, transaction
+from django.db.models import Q
 from rest_framework import serializers
-from django.shortcuts import get_object_or_404
 
 from reviews.models import (
     Comment,
     Category,
     Genre,
+    GenreTitle,
     Review,
     Title,
     year_validator,
@@ -47,6 +50,50 @@ class TitleGetSerializer(serializers.ModelSerializer):
         model = Title
 
 
+TITLE_BULK_MAX_ITEMS = 1000
+
+TITLE_LIST_FIELDS = (
+    'id',
+    'name',
+    'year',
+    'description',
+    'rating',
+    'review_count',
+    'category__name',
+    'category__slug',
+)
+
+
+def serialize_title_rows(rows):
+    """Повторяет вывод TitleGetSerializer(many=True) для строк values().
+
+    Жанры всех строк загружаются одним запросом, без создания моделей.
+    """
+    genres = defaultdict(list)
+    genre_rows = (
+        GenreTitle.objects.filter(title_id__in=[row['id'] for row in rows])
+        .order_by('genre__name')
+        .values_list('title_id', 'genre__name', 'genre__slug')
+    )
+    for title_id, name, slug in genre_rows:
+        genres[title_id].append({'name': name, 'slug': slug})
+    return [
+        {
+            'id': row['id'],
+            'name': row['name'],
+            'year': row['year'],
+            'description': row['description'],
+            'rating': None if row['rating'] is None else int(row['rating']),
+            'genre': genres[row['id']],
+            'category': None if row['category__slug'] is None else {
+                'name': row['category__name'],
+                'slug': row['category__slug'],
+            },
+        }
+        for row in rows
+    ]
+
+
 class TitleWriteSerliazer(serializers.ModelSerializer):
     year = serializers.IntegerField(validators=[year_validator])
     genre = serializers.SlugRelatedField(
@@ -64,6 +111,83 @@ class TitleWriteSerliazer(serializers.ModelSerializer):
         model = Title
 
 
+class TitleBulkListSerializer(serializers.ListSerializer):
+    """Находит все жанры и категории пакета двумя запросами."""
+
+    def __init__(self, *args, **kwargs):
+        kwargs.setdefault('max_length', TITLE_BULK_MAX_ITEMS)
+        super().__init__(*args, **kwargs)
+
+    def to_internal_value(self, data):
+        items = data if isinstance(data, list) else []
+        if len(items) > self.max_length:
+            # Слишком большой пакет отклонит проверка max_length.
+            items = []
+        items = [item for item in items if isinstance(item, dict)]
+        genre_slugs = {
+            slug
+            for item in items
+            if isinstance(item.get('genre'), list)
+            for slug in item['genre']
+            if isinstance(slug, str)
+        }
+        category_slugs = {
+            item['category']
+            for item in items
+            if isinstance(item.get('category'), str)
+        }
+        self.genres = Genre.objects.in_bulk(genre_slugs, field_name='slug')
+        self.categories = Category.objects.in_bulk(
+            category_slugs, field_name='slug'
+        )
+        return super().to_internal_value(data)
+
+    def create(self, validated_data):
+        genres = [item.pop('genre') for item in validated_data]
+        titles = Title.objects.bulk_create_with_genres(
+            [Title(**item) for item in validated_data], genres
+        )
+        for title, title_genres in zip(titles, genres):
+            title.created_genres = title_genres
+        return titles
+
+
+class TitleBulkSerializer(serializers.ModelSerializer):
+    year = serializers.IntegerField(validators=[year_validator])
+    genre = serializers.ListField(child=serializers.SlugField())
+    category = serializers.SlugField()
+
+    class Meta:
+        fields = ('id', 'name', 'year', 'genre', 'description', 'category')
+        model = Title
+        list_serializer_class = TitleBulkListSerializer
+
+    def get_by_slug(self, objects, slug):
+        if slug not in objects:
+            raise serializers.ValidationError(
+                serializers.SlugRelatedField.default_error_messages[
+                    'does_not_exist'
+                ].format(slug_name='slug', value=slug)
+            )
+        return objects[slug]
+
+    def validate_genre(self, slugs):
+        return [self.get_by_slug(self.parent.genres, slug) for slug in slugs]
+
+    def validate_category(self, slug):
+        return self.get_by_slug(self.parent.categories, slug)
+
+    def to_representation(self, instance):
+        return {
+            'id': instance.id,
+            'name': instance.name,
+            'year': instance.year,
+            'genre': [genre.slug for genre in instance.created_genres],
+            'description': instance.description,
+            'category': instance.category.slug,
+        }
+
+
 class ReviewSerializer(serializers.ModelSerializer):
     author = serializers.SlugRelatedField(
         read_only=True,
@@ -78,10 +202,17 @@ class ReviewSerializer(serializers.ModelSerializer):
             'author',
             'score',
             'pub_date',
+            'comment_count',
         )
         read_only_fields = ('title',)
 
 
+class ReviewFeedSerializer(ReviewSerializer):
+    class Meta(ReviewSerializer.Meta):
+        fields = ('title', *ReviewSerializer.Meta.fields)
+        read_only_fields = ('title',)
+
+
 class CommentSerializer(serializers.ModelSerializer):
     author = serializers.SlugRelatedField(
         read_only=True,
@@ -93,12 +224,6 @@ class CommentSerializer(serializers.ModelSerializer):
         fields = ('id', 'text', 'author', 'pub_date')
         read_only_fields = ('review',)
 
-    def create(self, validated_data):
-        validated_data['author'] = self.context['request'].user
-        review_id = self.context['view'].kwargs['review_id']
-        validated_data['review'] = get_object_or_404(Review, id=review_id)
-        return super().create(validated_data)
-
 
 class UserCreateSerializer(serializers.ModelSerializer):
     email = serializers.EmailField(max_length=254, required=True)
@@ -109,23 +234,34 @@ class UserCreateSerializer(serializers.ModelSerializer):
         fields = ('username', 'email')
 
     def create(self, validated_data):
+        """Находит пользователя с этой парой или создаёт нового.
+
+        Пользователь с той же парой username и email единственный, кого
+        найдёт запрос по уникальным индексам, поэтому хватает одной строки
+        и не больше одной вставки.
+        """
         email = validated_data.get('email')
         username = validated_data.get('username')
-        if User.objects.filter(email=email, username=username).exists():
-            return User.objects.filter(email=email, username=username)
-        else:
-            if (
-                User.objects.filter(username=username).exists()
-                or User.objects.filter(email=email).exists()
-            ):
-                raise serializers.ValidationError(
-                    {'username': ['Не ваша почта или ник!']}
+        user = User.objects.filter(
+            Q(username=username) | Q(email=email)
+        ).first()
+        if user is not None:
+            if user.username == username and user.email == email:
+                return user
+            raise serializers.ValidationError(
+                {'username': ['Не ваша почта или ник!']}
+            )
+        try:
+            with transaction.atomic():
+                return User.objects.create_user(
+                    email=email,
+                    username=username,
+                    is_active=False,
                 )
-        return User.objects.create_user(
-            email=email,
-            username=username,
-            is_active=False,
-        )
+        except IntegrityError:
+            raise serializers.ValidationError(
+                {'username': ['Не ваша почта или ник!']}
+            )
 
     def validate_username(self, username):
         if username == 'me':
@@ -0,0 +1,62 @@
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from reviews.models import Category, Genre, GenreTitle, Review, Title
+from reviews.signals import ratings_recalculated
+
+from .authentication import remember_token_claims, token_claims, user_cache
+from .cache import bump_model_version
+
+User = get_user_model()
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+@receiver(post_save, sender=Genre)
+@receiver(post_delete, sender=Genre)
+@receiver(post_save, sender=Title)
+@receiver(post_delete, sender=Title)
+def catalog_changed(sender, **kwargs):
+    """Меняет версию только после COMMIT.
+
+    Иначе параллельный запрос успеет сохранить в кэше данные до изменения
+    под новой версией.
+    """
+    transaction.on_commit(lambda: bump_model_version(sender))
+
+
+@receiver(post_save, sender=Review)
+@receiver(post_delete, sender=Review)
+@receiver(post_save, sender=GenreTitle)
+@receiver(post_delete, sender=GenreTitle)
+@receiver(m2m_changed, sender=Title.genre.through)
+def title_related_changed(sender, **kwargs):
+    """Отзывы меняют рейтинг, а связи - жанры в ответе о произведении.
+
+    Как и в catalog_changed, версия меняется после COMMIT: иначе клиент
+    получит новый ETag вместе со старыми данными и будет получать 304.
+    """
+    transaction.on_commit(lambda: bump_model_version(Title))
+
+
+@receiver(ratings_recalculated)
+def ratings_flushed(sender, **kwargs):
+    transaction.on_commit(lambda: bump_model_version(Title))
+
+
+@receiver(post_save, sender=User)
+def user_saved(sender, instance, created, **kwargs):
+    """Токены со старыми ролью или username перестают приниматься."""
+    if not created:
+        user_cache.invalidate(instance.pk)
+        remember_token_claims(
+            instance.pk, token_claims(instance) if instance.is_active else {}
+        )
+
+
+@receiver(post_delete, sender=User)
+def user_deleted(sender, instance, **kwargs):
+    user_cache.invalidate(instance.pk)
+    remember_token_claims(instance.pk, {})
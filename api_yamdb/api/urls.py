@@ -5,8 +5,10 @@ from .views import (
     CommentViewSet,
     CategoryViewSet,
     GenreViewSet,
+    ReviewFeedViewSet,
     ReviewViewSet,
     TitleViewSet,
+    UserCacheStatsView,
     UserViewSet,
     UserCreateViewSet,
     UserGetTokenViewSet,
@@ -24,6 +26,7 @@ router.register(
     CommentViewSet,
     basename='comments',
 )
+router.register('reviews', ReviewFeedViewSet, basename='review-feed')
 router.register('users', UserViewSet, basename='users')
 
 
@@ -31,4 +34,9 @@ urlpatterns = [
     path('v1/', include(router.urls)),
     path('v1/auth/signup/', UserCreateViewSet.as_view(), name='signup'),
     path('v1/auth/token/', UserGetTokenViewSet.as_view(), name='token'),
+    path(
+        'v1/auth/user-cache/',
+        UserCacheStatsView.as_view(),
+        name='user-cache',
+    ),
 ]
@@ -1,41 +1,77 @@
-from django.conf import settings
+from collections import defaultdict
+
 from django.contrib.auth import get_user_model
 from django.contrib.auth.tokens import default_token_generator
-from django.core.mail import send_mail
-from django.db.models import Avg
+from django.db import IntegrityError
+from django.http import StreamingHttpResponse
 from django.shortcuts import get_object_or_404
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import etag
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import filters, serializers, status, views, viewsets
 from rest_framework.decorators import action
-from rest_framework.filters import OrderingFilter, SearchFilter
+from rest_framework.filters import SearchFilter
 from rest_framework.mixins import (CreateModelMixin, DestroyModelMixin,
                                    ListModelMixin)
 from rest_framework.pagination import PageNumberPagination
 from rest_framework.permissions import AllowAny, IsAuthenticated
+from rest_framework.renderers import JSONRenderer
 from rest_framework.response import Response
+from rest_framework.reverse import reverse
 from rest_framework.views import APIView
 from rest_framework.viewsets import GenericViewSet, ModelViewSet
-from rest_framework_simplejwt.tokens import AccessToken
-from reviews.models import Category, Genre, Review, Title
-
-from .filters import TitlesFilter
+from reviews.models import (SCORES, Category, Comment, Genre, Review, Title,
+                            score_field, stored_facets)
+from user.mail import queue_mail
+
+from .authentication import access_token_for, user_cache
+from .cache import (VersionedListCacheMixin, bump_model_version,
+                    versions_etag)
+from .filters import TitleOrderingFilter, TitlesFilter
+from .pagination import (CommentCursorPagination, ReviewCursorPagination,
+                         TitleCursorPagination)
 from .permissions import (AdminOnly, IsAdminModeratorAuthorOrReadOnly,
                           IsAdminOrReadOnly)
-from .serializers import (CategorySerializer, CommentSerializer,
-                          GenreSerializer, ReviewSerializer,
-                          TitleGetSerializer, TitleWriteSerliazer,
-                          UserCreateSerializer, UserGetTokenSerializer,
-                          UserSerializer)
+from .serializers import (TITLE_LIST_FIELDS, CategorySerializer,
+                          CommentSerializer, GenreSerializer,
+                          ReviewFeedSerializer, ReviewSerializer,
+                          TitleBulkSerializer, TitleGetSerializer,
+                          TitleWriteSerliazer, UserCreateSerializer,
+                          UserGetTokenSerializer, UserSerializer,
+                          serialize_title_rows)
 
 User = get_user_model()
 
+REVIEW_EXPORT_CHUNK_SIZE = 500
+REVIEW_FEED_MAX_TITLES = 50
+REVIEW_FEED_PER_TITLE = 3
+REVIEW_FEED_MAX_PER_TITLE = 20
+MAX_ID = 2 ** 63 - 1
+
+titles_etag = method_decorator(etag(versions_etag(Title, Genre, Category)))
+
 
 class TitleReviewCommentMixin(ModelViewSet):
     http_method_names = ['get', 'post', 'delete', 'patch']
+    cursor_pagination_class = None
+
+    @property
+    def paginator(self):
+        """Курсорная пагинация по запросу с параметром ?pagination=cursor."""
+        if (
+            not hasattr(self, '_paginator')
+            and self.request.query_params.get('pagination') == 'cursor'
+        ):
+            self._paginator = self.cursor_pagination_class()
+        return super().paginator
 
 
 class CategoryGenreMixin(
-    ListModelMixin, CreateModelMixin, DestroyModelMixin, GenericViewSet
+    VersionedListCacheMixin,
+    ListModelMixin,
+    CreateModelMixin,
+    DestroyModelMixin,
+    GenericViewSet,
 ):
     pagination_class = PageNumberPagination
     permission_classes = (IsAdminOrReadOnly,)
@@ -55,48 +91,215 @@ class GenreViewSet(CategoryGenreMixin):
 
 
 class TitleViewSet(TitleReviewCommentMixin):
-    queryset = Title.objects.annotate(rating=Avg('reviews__score'))
+    queryset = Title.objects.select_related('category').prefetch_related(
+        'genre'
+    )
     permission_classes = (IsAdminOrReadOnly,)
-    filter_backends = (DjangoFilterBackend, OrderingFilter)
-    ordering_fields = ('name',)
+    filter_backends = (DjangoFilterBackend, TitleOrderingFilter)
+    ordering_fields = ('name', 'rating', 'year', 'review_count')
     filterset_class = TitlesFilter
+    cursor_pagination_class = TitleCursorPagination
+    facet_params = tuple(TitlesFilter.base_filters)
 
     def get_serializer_class(self):
         if self.action in ('list', 'retrieve'):
             return TitleGetSerializer
+        if self.action == 'bulk':
+            return TitleBulkSerializer
         return TitleWriteSerliazer
 
+    @titles_etag
+    @action(detail=True, methods=['get'])
+    def scores(self, request, pk):
+        """Распределение оценок произведения из счётчиков Title."""
+        title = get_object_or_404(
+            Title.objects.only(*(score_field(score) for score in SCORES)),
+            pk=pk,
+        )
+        return Response(title.score_distribution)
+
+    @action(detail=False, methods=['post'])
+    def bulk(self, request):
+        """Создание списка произведений одним запросом."""
+        serializer = self.get_serializer(data=request.data, many=True)
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+        bump_model_version(Title)
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
+
+    @titles_etag
+    def list(self, request, *args, **kwargs):
+        """Список без моделей и сериализатора: строки values() в словари."""
+        queryset = (
+            self.filter_queryset(self.get_queryset())
+            .prefetch_related(None)
+            .values(*TITLE_LIST_FIELDS)
+        )
+        page = self.paginate_queryset(queryset)
+        if page is None:
+            return Response(serialize_title_rows(list(queryset)))
+        return self.get_paginated_response(serialize_title_rows(page))
+
+    @titles_etag
+    def retrieve(self, request, *args, **kwargs):
+        return super().retrieve(request, *args, **kwargs)
+
+    @action(detail=False, methods=['get'])
+    def facets(self, request):
+        """Количество произведений по жанрам, категориям и десятилетиям."""
+        if any(param in request.query_params for param in self.facet_params):
+            return Response(
+                self.filter_queryset(self.get_queryset()).facets()
+            )
+        return Response(stored_facets())
+
 
 class ReviewViewSet(TitleReviewCommentMixin):
     serializer_class = ReviewSerializer
     permission_classes = (IsAdminModeratorAuthorOrReadOnly,)
+    cursor_pagination_class = ReviewCursorPagination
+
+    def get_title(self):
+        """Произведение из URL, загружается один раз за запрос."""
+        if not hasattr(self, '_title'):
+            self._title = get_object_or_404(
+                Title, id=self.kwargs.get('title_id')
+            )
+        return self._title
 
     def get_queryset(self):
-        title = get_object_or_404(Title, id=self.kwargs.get('title_id'))
-        return title.reviews.all()
+        return self.get_title().reviews.select_related('author')
 
     def perform_create(self, serializer):
-        title = get_object_or_404(Title, id=self.kwargs['title_id'])
-        author = self.request.user
-        if Review.objects.filter(title=title, author=author).exists():
+        # Повторный отзыв отсекает ограничение unique_review в БД. Прочие
+        # нарушения целостности, например удалённый автор, не повторы.
+        title = self.get_title()
+        try:
+            serializer.save(author=self.request.user, title=title)
+        except IntegrityError:
+            if not Review.objects.filter(
+                title=title, author_id=self.request.user.pk
+            ).exists():
+                raise
             raise serializers.ValidationError(
                 "Отзыв на это произведение уже есть")
-        serializer.save(author=author, title=title)
+
+    @action(detail=True, methods=['get'])
+    def thread(self, request, title_id, pk):
+        """Отзыв с первой страницей комментариев за два запроса."""
+        review = get_object_or_404(
+            Review.objects.select_related('author'), pk=pk, title_id=title_id
+        )
+        self.check_object_permissions(request, review)
+        paginator = CommentCursorPagination()
+        comments = paginator.paginate_queryset(
+            review.comments.select_related('author'), request, self
+        )
+        # Ссылки пагинации ведут на обычный список комментариев.
+        paginator.base_url = reverse(
+            'comments-list',
+            kwargs={'title_id': title_id, 'review_id': pk},
+            request=request,
+        ) + '?pagination=cursor'
+        data = ReviewSerializer(review).data
+        data['comments'] = paginator.get_paginated_response(
+            CommentSerializer(comments, many=True).data
+        ).data
+        return Response(data)
+
+    @action(detail=False, methods=['get'])
+    def export(self, request, title_id):
+        """Все отзывы произведения потоком NDJSON, ?comments=1 - с ответами."""
+        with_comments = request.query_params.get('comments') in ('1', 'true')
+        return StreamingHttpResponse(
+            self.export_lines(self.get_title(), with_comments),
+            content_type='application/x-ndjson',
+        )
+
+    def export_lines(self, title, with_comments):
+        """Читает отзывы пачками по id, память не растёт с их числом."""
+        renderer = JSONRenderer()
+        reviews = title.reviews.select_related('author').order_by('id')
+        last_id = 0
+        while True:
+            chunk = list(
+                reviews.filter(id__gt=last_id)[:REVIEW_EXPORT_CHUNK_SIZE]
+            )
+            if not chunk:
+                return
+            comments = defaultdict(list)
+            if with_comments:
+                for comment in (
+                    Comment.objects.filter(review__in=chunk)
+                    .select_related('author')
+                    .order_by('id')
+                ):
+                    comments[comment.review_id].append(
+                        CommentSerializer(comment).data
+                    )
+            for review in chunk:
+                data = ReviewSerializer(review).data
+                if with_comments:
+                    data['comments'] = comments[review.id]
+                yield renderer.render(data) + b'\n'
+            last_id = chunk[-1].id
+
+
+class ReviewFeedViewSet(ListModelMixin, GenericViewSet):
+    """Последние отзывы сразу для нескольких произведений."""
+
+    serializer_class = ReviewFeedSerializer
+    permission_classes = (AllowAny,)
+    pagination_class = None
+
+    def get_queryset(self):
+        params = self.request.query_params
+        title_ids = params.get('title_ids', '').split(',')
+        per_title = params.get('per_title', str(REVIEW_FEED_PER_TITLE))
+        if not (
+            len(title_ids) <= REVIEW_FEED_MAX_TITLES
+            and all(
+                title_id.isdecimal() and int(title_id) <= MAX_ID
+                for title_id in title_ids
+            )
+        ):
+            raise serializers.ValidationError({
+                'title_ids': f'Укажите от 1 до {REVIEW_FEED_MAX_TITLES} id '
+                             'произведений через запятую.'
+            })
+        if not (
+            per_title.isdecimal()
+            and 0 < int(per_title) <= REVIEW_FEED_MAX_PER_TITLE
+        ):
+            raise serializers.ValidationError({
+                'per_title': 'Ожидается целое число от 1 до '
+                             f'{REVIEW_FEED_MAX_PER_TITLE}.'
+            })
+        return Review.objects.latest_per_title(
+            set(map(int, title_ids)), int(per_title)
+        ).select_related('author')
 
 
 class CommentViewSet(TitleReviewCommentMixin):
     serializer_class = CommentSerializer
     permission_classes = (IsAdminModeratorAuthorOrReadOnly,)
+    cursor_pagination_class = CommentCursorPagination
+
+    def get_review(self):
+        """Отзыв из URL с проверкой произведения, один запрос за запрос."""
+        if not hasattr(self, '_review'):
+            self._review = get_object_or_404(
+                Review,
+                id=self.kwargs.get('review_id'),
+                title_id=self.kwargs.get('title_id'),
+            )
+        return self._review
 
     def get_queryset(self):
-        review = get_object_or_404(Review, id=self.kwargs.get('review_id'))
-        return review.comments.all()
+        return self.get_review().comments.select_related('author')
 
     def perform_create(self, serializer):
-        title_id = self.kwargs.get('title_id')
-        review_id = self.kwargs.get('review_id')
-        review = get_object_or_404(Review, id=review_id, title=title_id)
-        serializer.save(author=self.request.user, review=review)
+        serializer.save(author=self.request.user, review=self.get_review())
 
 
 class UserCreateViewSet(APIView):
@@ -106,23 +309,13 @@ class UserCreateViewSet(APIView):
     def post(self, request):
         serializer = self.serializer_class(data=request.data)
         serializer.is_valid(raise_exception=True)
-        serializer.save()
-
-        user = get_object_or_404(User, username=request.data.get('username'))
+        user = serializer.save()
         confirmation_code = default_token_generator.make_token(user)
 
         subject = 'YaMDB'
         message = 'Ваш секретный код - ' + confirmation_code
 
-        send_mail(
-            subject,
-            message,
-            settings.DEFAULT_FROM_EMAIL,
-            [
-                user.email,
-            ],
-            fail_silently=False,
-        )
+        queue_mail(subject, message, user.email)
 
         return Response(
             {'username': user.username, 'email': user.email},
@@ -145,10 +338,17 @@ class UserGetTokenViewSet(views.APIView):
         if not default_token_generator.check_token(user, confirmation_code):
             message = {'confirmation_code': 'Код подтверждения невалиден'}
             return Response(message, status=status.HTTP_400_BAD_REQUEST)
-        message = {'token': str(AccessToken.for_user(user))}
+        message = {'token': str(access_token_for(user))}
         return Response(message, status=status.HTTP_200_OK)
 
 
+class UserCacheStatsView(APIView):
+    permission_classes = (AdminOnly,)
+
+    def get(self, request):
+        return Response(user_cache.stats())
+
+
 class UserViewSet(viewsets.ModelViewSet):
     permission_classes = (AdminOnly,)
     queryset = User.objects.all()
@@ -184,12 +384,13 @@ class UserViewSet(viewsets.ModelViewSet):
         permission_classes=(IsAuthenticated,),
     )
     def me(self, request):
+        user = request.user
+        if getattr(user, 'from_token', False):
+            user = get_object_or_404(User, pk=user.pk)
         if request.method == 'PATCH':
-            serializer = UserSerializer(
-                request.user, data=request.data, partial=True
-            )
+            serializer = UserSerializer(user, data=request.data, partial=True)
             serializer.is_valid(raise_exception=True)
-            serializer.save(role=request.user.role)
+            serializer.save(role=user.role)
             return Response(serializer.data, status=status.HTTP_200_OK)
-        serializer = UserSerializer(request.user)
+        serializer = UserSerializer(user)
         return Response(serializer.data, status=status.HTTP_200_OK)
@@ -74,6 +74,36 @@ DATABASES = {
 }
 
 
+# Cache
+# Версии таблиц для кэша ответов хранятся здесь же. LocMemCache у каждого
+# процесса свой и не видит изменений из других, поэтому версии и ответы в
+# нём живут секунды. С общим бэкендом (Redis, Memcached) - сутки.
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    }
+}
+
+API_RESPONSE_CACHE_TIMEOUT = (
+    10
+    if CACHES['default']['BACKEND'].endswith('.LocMemCache')
+    else 60 * 60 * 24
+)
+
+
+# Rating
+# В буферизованном режиме отзывы только помечают произведение, а рейтинг
+# пересчитывает команда flush_ratings. Окно устаревания рейтинга не больше
+# RATING_FLUSH_INTERVAL секунд плюс время пересчёта пачки.
+
+RATING_BUFFERED = False
+
+RATING_FLUSH_INTERVAL = 0.25
+
+RATING_FLUSH_BATCH_SIZE = 100
+
+
 # Password validation
 
 AUTH_PASSWORD_VALIDATORS = [
@@ -117,7 +147,7 @@ REST_FRAMEWORK = {
         'rest_framework.permissions.IsAuthenticated',
     ],
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'api.authentication.ClaimsJWTAuthentication',
     ],
     'DEFAULT_FILTER_BACKENDS': [
         'django_filters.rest_framework.DjangoFilterBackend'
@@ -157,4 +187,38 @@ SIMPLE_JWT = {
     'SLIDING_TOKEN_REFRESH_LIFETIME': timedelta(days=1),
 }
 
+# При JWT_STATELESS токен несёт роль и username, и запросы проверяют права
+# без обращения к таблице пользователей: её актуальные данные хранятся в
+# кэше JWT_CLAIMS_CACHE_TTL секунд. Смена роли или удаление сразу обновляют
+# запись в общем кэше; если записи нет, данные перечитываются из БД, так
+# что вытеснение из кэша не возвращает силу отозванным токенам. С
+# кэшем в памяти процесса другие процессы узнают об отзыве не позже TTL.
+
+JWT_STATELESS = False
+
+JWT_CLAIMS_CACHE_TTL = 60 * 5
+
+# Пользователи для остальных токенов кэшируются в памяти процесса.
+# Долю попаданий показывает /api/v1/auth/user-cache/.
+
+USER_CACHE_SIZE = 1024
+
+USER_CACHE_TTL = 30
+
 DEFAULT_FROM_EMAIL = 'Tech Support <YaMDB@support.ru>'
+
+
+# Email queue
+# Письма с кодом подтверждения отправляет команда send_queued_mail: до
+# EMAIL_QUEUE_BATCH_SIZE писем через одно соединение раз в
+# EMAIL_QUEUE_INTERVAL секунд. Скорость видна с ключом -v 2.
+# Неудачная попытка повторяется через EMAIL_QUEUE_RETRY_DELAY секунд,
+# пауза удваивается с каждой следующей ошибкой.
+
+EMAIL_QUEUE_INTERVAL = 1
+
+EMAIL_QUEUE_BATCH_SIZE = 50
+
+EMAIL_QUEUE_MAX_ATTEMPTS = 5
+
+EMAIL_QUEUE_RETRY_DELAY = 30
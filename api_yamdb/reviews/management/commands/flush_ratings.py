@@ -0,0 +1,39 @@
+import time
+
+from django.conf import settings
+from django.core.management import BaseCommand
+
+from reviews.signals import flush_dirty_titles
+
+
+class Command(BaseCommand):
+    help = 'Пересчитывает рейтинг произведений, помеченных отзывами.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='Обработать накопленные отметки и завершиться.',
+        )
+        parser.add_argument(
+            '--interval',
+            type=float,
+            default=settings.RATING_FLUSH_INTERVAL,
+            help='Пауза между пачками в секундах.',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=settings.RATING_FLUSH_BATCH_SIZE,
+            help='Сколько произведений пересчитывать за раз.',
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        while True:
+            flushed = flush_dirty_titles(batch_size)
+            while flushed == batch_size:
+                flushed = flush_dirty_titles(batch_size)
+            if options['once']:
+                return
+            time.sleep(options['interval'])
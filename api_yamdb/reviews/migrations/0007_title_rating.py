@@ -0,0 +1,60 @@
+# Generated by Django 3.2 on 2026-10-18 17:03
+
+from django.db import migrations, models
+from django.db.models import Avg, Count, Sum
+
+
+def fill_title_rating(apps, schema_editor):
+    Title = apps.get_model('reviews', 'Title')
+    titles = Title.objects.annotate(
+        total_reviews=Count('reviews'),
+        total_score=Sum('reviews__score'),
+        avg_score=Avg('reviews__score'),
+    ).filter(total_reviews__gt=0)
+    for title in titles.iterator():
+        Title.objects.filter(pk=title.pk).update(
+            review_count=title.total_reviews,
+            score_sum=title.total_score,
+            rating=title.avg_score,
+        )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('reviews', '0006_auto_20231029_1519'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='title',
+            name='rating',
+            field=models.FloatField(
+                editable=False, null=True, verbose_name='Рейтинг'
+            ),
+        ),
+        migrations.AddField(
+            model_name='title',
+            name='review_count',
+            field=models.PositiveIntegerField(
+                default=0, editable=False, verbose_name='Количество отзывов'
+            ),
+        ),
+        migrations.AddField(
+            model_name='title',
+            name='score_sum',
+            field=models.PositiveIntegerField(
+                default=0, editable=False, verbose_name='Сумма оценок'
+            ),
+        ),
+        migrations.AlterField(
+            model_name='category',
+            name='slug',
+            field=models.SlugField(unique=True, verbose_name='Слаг'),
+        ),
+        migrations.AlterField(
+            model_name='genre',
+            name='slug',
+            field=models.SlugField(unique=True, verbose_name='Слаг'),
+        ),
+        migrations.RunPython(fill_title_rating, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,15 @@
+# Generated by Django 3.2 on 2026-10-18 17:10
+
+from django.db import migrations
+
+from reviews.search import create_search_index
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('reviews', '0009_title_ordering_indexes'),
+    ]
+
+    operations = [
+        create_search_index(),
+    ]
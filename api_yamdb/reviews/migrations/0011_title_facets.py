@@ -0,0 +1,116 @@
+# Generated by Django 3.2 on 2026-10-18 17:08
+
+from django.db import migrations, models
+import django.db.models.deletion
+from django.db.models import Count, F
+
+
+def fill_facets(apps, schema_editor):
+    Title = apps.get_model('reviews', 'Title')
+    GenreTitle = apps.get_model('reviews', 'GenreTitle')
+    genres = GenreTitle.objects.values('genre_id').annotate(total=Count('id'))
+    categories = (
+        Title.objects.filter(category__isnull=False)
+        .values('category_id')
+        .annotate(total=Count('id'))
+    )
+    decades = (
+        Title.objects.annotate(decade=F('year') / 10 * 10)
+        .values('decade')
+        .annotate(total=Count('id'))
+    )
+    for model_name, key, rows in (
+        ('GenreFacet', 'genre_id', genres),
+        ('CategoryFacet', 'category_id', categories),
+        ('DecadeFacet', 'decade', decades),
+    ):
+        model = apps.get_model('reviews', model_name)
+        model.objects.bulk_create(
+            model(**{key: row[key]}, count=row['total'])
+            for row in rows.order_by()
+        )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('reviews', '0010_title_search'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CategoryFacet',
+            fields=[
+                (
+                    'count',
+                    models.PositiveIntegerField(
+                        default=0, verbose_name='Количество произведений'
+                    ),
+                ),
+                (
+                    'category',
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name='facet',
+                        serialize=False,
+                        to='reviews.category',
+                        verbose_name='Категория',
+                    ),
+                ),
+            ],
+            options={
+                'verbose_name': 'Фасет категории',
+                'verbose_name_plural': 'Фасеты категорий',
+            },
+        ),
+        migrations.CreateModel(
+            name='DecadeFacet',
+            fields=[
+                (
+                    'count',
+                    models.PositiveIntegerField(
+                        default=0, verbose_name='Количество произведений'
+                    ),
+                ),
+                (
+                    'decade',
+                    models.PositiveIntegerField(
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name='Десятилетие',
+                    ),
+                ),
+            ],
+            options={
+                'verbose_name': 'Фасет десятилетия',
+                'verbose_name_plural': 'Фасеты десятилетий',
+            },
+        ),
+        migrations.CreateModel(
+            name='GenreFacet',
+            fields=[
+                (
+                    'count',
+                    models.PositiveIntegerField(
+                        default=0, verbose_name='Количество произведений'
+                    ),
+                ),
+                (
+                    'genre',
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name='facet',
+                        serialize=False,
+                        to='reviews.genre',
+                        verbose_name='Жанр',
+                    ),
+                ),
+            ],
+            options={
+                'verbose_name': 'Фасет жанра',
+                'verbose_name_plural': 'Фасеты жанров',
+            },
+        ),
+        migrations.RunPython(fill_facets, migrations.RunPython.noop),
+    ]
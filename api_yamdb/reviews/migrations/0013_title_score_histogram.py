@@ -0,0 +1,104 @@
+# Generated by Django 3.2 on 2026-10-18 17:19
+
+from django.db import migrations, models
+from django.db.models import Count, Q
+
+from reviews.search import create_search_triggers
+
+
+def fill_score_histogram(apps, schema_editor):
+    Title = apps.get_model('reviews', 'Title')
+    Review = apps.get_model('reviews', 'Review')
+    histograms = (
+        Review.objects.values('title_id')
+        .annotate(
+            **{
+                f'score_{score}_count': Count('id', filter=Q(score=score))
+                for score in range(1, 11)
+            }
+        )
+        .order_by()
+    )
+    for histogram in histograms.iterator():
+        Title.objects.filter(pk=histogram.pop('title_id')).update(**histogram)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('reviews', '0012_review_comment_count'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='title',
+            name='score_10_count',
+            field=models.PositiveIntegerField(
+                default=0, editable=False, verbose_name='Отзывов с оценкой 10'
+            ),
+        ),
+        migrations.AddField(
+            model_name='title',
+            name='score_1_count',
+            field=models.PositiveIntegerField(
+                default=0, editable=False, verbose_name='Отзывов с оценкой 1'
+            ),
+        ),
+        migrations.AddField(
+            model_name='title',
+            name='score_2_count',
+            field=models.PositiveIntegerField(
+                default=0, editable=False, verbose_name='Отзывов с оценкой 2'
+            ),
+        ),
+        migrations.AddField(
+            model_name='title',
+            name='score_3_count',
+            field=models.PositiveIntegerField(
+                default=0, editable=False, verbose_name='Отзывов с оценкой 3'
+            ),
+        ),
+        migrations.AddField(
+            model_name='title',
+            name='score_4_count',
+            field=models.PositiveIntegerField(
+                default=0, editable=False, verbose_name='Отзывов с оценкой 4'
+            ),
+        ),
+        migrations.AddField(
+            model_name='title',
+            name='score_5_count',
+            field=models.PositiveIntegerField(
+                default=0, editable=False, verbose_name='Отзывов с оценкой 5'
+            ),
+        ),
+        migrations.AddField(
+            model_name='title',
+            name='score_6_count',
+            field=models.PositiveIntegerField(
+                default=0, editable=False, verbose_name='Отзывов с оценкой 6'
+            ),
+        ),
+        migrations.AddField(
+            model_name='title',
+            name='score_7_count',
+            field=models.PositiveIntegerField(
+                default=0, editable=False, verbose_name='Отзывов с оценкой 7'
+            ),
+        ),
+        migrations.AddField(
+            model_name='title',
+            name='score_8_count',
+            field=models.PositiveIntegerField(
+                default=0, editable=False, verbose_name='Отзывов с оценкой 8'
+            ),
+        ),
+        migrations.AddField(
+            model_name='title',
+            name='score_9_count',
+            field=models.PositiveIntegerField(
+                default=0, editable=False, verbose_name='Отзывов с оценкой 9'
+            ),
+        ),
+        migrations.RunPython(fill_score_histogram, migrations.RunPython.noop),
+        create_search_triggers(),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 3.2 on 2026-10-18 17:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('reviews', '0014_feed_ordering'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DirtyTitle',
+            fields=[
+                (
+                    'id',
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name='ID',
+                    ),
+                ),
+                (
+                    'title_id',
+                    models.PositiveIntegerField(
+                        db_index=True, verbose_name='Произведение'
+                    ),
+                ),
+            ],
+            options={
+                'verbose_name': 'Отметка пересчёта рейтинга',
+                'verbose_name_plural': 'Отметки пересчёта рейтинга',
+            },
+        ),
+    ]
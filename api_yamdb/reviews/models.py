@@ -1,16 +1,35 @@
 import datetime
+from collections import Counter
 
 from django.core.validators import (
     MaxValueValidator,
     MinValueValidator,
 )
-from django.db import models
+from django.db import IntegrityError, connection, models, transaction
+from django.db.models.expressions import RawSQL
+from django.db.models.functions import RowNumber
 from django.forms import ValidationError
 
 from user.models import User
 
+from .search import SEARCH_TABLE
+
 
 LENGTH_COMMENT = 20
+SCORES = range(1, 11)
+
+
+def score_field(score):
+    """Имя поля Title со счётчиком отзывов с данной оценкой."""
+    return f'score_{score}_count'
+
+
+def score_count_field(score):
+    return models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        verbose_name=f'Отзывов с оценкой {score}',
+    )
 
 
 def year_validator(value):
@@ -64,7 +83,127 @@ class Genre(models.Model):
         return self.name
 
 
-class Title(models.Model):
+class CounterModel(models.Model):
+    """Модель со счётчиками, которые меняют только сигналы через F().
+
+    Сохранение идёт в транзакции, чтобы обработчики post_save обновляли
+    связанные счётчики атомарно с записью. При изменении существующей
+    строки счётчики исключаются из UPDATE, чтобы не перезаписать их
+    устаревшими значениями из памяти.
+    """
+
+    counter_fields = ()
+
+    class Meta:
+        abstract = True
+
+    def save(self, *args, **kwargs):
+        if not self._state.adding and kwargs.get('update_fields') is None:
+            kwargs['update_fields'] = [
+                field.name
+                for field in self._meta.concrete_fields
+                if not field.primary_key
+                and field.name not in self.counter_fields
+            ]
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+
+
+def build_search_query(value):
+    """Превращает ввод пользователя в безопасный запрос FTS5 по префиксам."""
+    terms = value.replace('"', ' ').split()
+    return ' '.join(f'"{term}"*' for term in terms)
+
+
+class TitleQuerySet(models.QuerySet):
+    def search(self, value):
+        """Полнотекстовый поиск по названию и описанию с ранжированием."""
+        query = build_search_query(value)
+        if not query:
+            return self.none()
+        if connection.vendor != 'sqlite':
+            return self.filter(
+                models.Q(name__icontains=value)
+                | models.Q(description__icontains=value)
+            )
+        rank = RawSQL(
+            f'SELECT rank FROM {SEARCH_TABLE} '
+            f'WHERE {SEARCH_TABLE} MATCH %s '
+            f'AND rowid = {Title._meta.db_table}.id',
+            (query,),
+        )
+        matches = RawSQL(
+            f'SELECT rowid FROM {SEARCH_TABLE} '
+            f'WHERE {SEARCH_TABLE} MATCH %s',
+            (query,),
+        )
+        return (
+            self.filter(id__in=matches)
+            .annotate(search_rank=rank)
+            .order_by('search_rank', '-id')
+        )
+
+    def facets(self):
+        """Фасеты выборки: жанры, категории и десятилетия."""
+        titles = self.model.objects.filter(
+            id__in=self.order_by().values('id')
+        )
+        genres = (
+            GenreTitle.objects.filter(title__in=titles.values('id'))
+            .values_list('genre__slug')
+            .annotate(count=models.Count('title', distinct=True))
+            .order_by()
+        )
+        categories = (
+            titles.filter(category__isnull=False)
+            .values_list('category__slug')
+            .annotate(count=models.Count('id'))
+            .order_by()
+        )
+        decades = (
+            titles.annotate(decade=models.F('year') / 10 * 10)
+            .values_list('decade')
+            .annotate(count=models.Count('id'))
+            .order_by()
+        )
+        return {
+            'genre': dict(genres),
+            'category': dict(categories),
+            'decade': dict(decades),
+        }
+
+    def bulk_create_with_genres(self, titles, genres):
+        """Создаёт произведения и их жанры пакетами в одной транзакции.
+
+        genres - списки жанров в порядке titles. Сигналы при bulk_create
+        не отправляются, поэтому счётчики фасетов сдвигаются здесь.
+        """
+        with transaction.atomic(using=self.db):
+            self.bulk_create(titles)
+            if titles and titles[0].pk is None:
+                # SQLite в Django 3.2 не возвращает id из bulk_create.
+                # Запись заблокирована до конца транзакции, а id растут
+                # (AUTOINCREMENT), так что новые строки - последние по id.
+                ids = self.order_by('-id').values_list('id', flat=True)
+                for title, pk in zip(titles, reversed(ids[:len(titles)])):
+                    title.pk = pk
+            links = [
+                GenreTitle(title=title, genre=genre)
+                for title, title_genres in zip(titles, genres)
+                for genre in title_genres
+            ]
+            GenreTitle.objects.using(self.db).bulk_create(links)
+            for model, keys in (
+                (CategoryFacet, (title.category_id for title in titles)),
+                (DecadeFacet, (title.decade for title in titles)),
+                (GenreFacet, (link.genre_id for link in links)),
+            ):
+                for key, delta in Counter(keys).items():
+                    model.shift(key, delta)
+        return titles
+
+
+class Title(CounterModel):
     name = models.CharField(
         max_length=256,
         verbose_name='Название',
@@ -84,6 +223,39 @@ class Title(models.Model):
         related_name='titles',
         null=True,
     )
+    rating = models.FloatField(
+        null=True,
+        editable=False,
+        verbose_name='Рейтинг',
+    )
+    review_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        verbose_name='Количество отзывов',
+    )
+    score_sum = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        verbose_name='Сумма оценок',
+    )
+    score_1_count = score_count_field(1)
+    score_2_count = score_count_field(2)
+    score_3_count = score_count_field(3)
+    score_4_count = score_count_field(4)
+    score_5_count = score_count_field(5)
+    score_6_count = score_count_field(6)
+    score_7_count = score_count_field(7)
+    score_8_count = score_count_field(8)
+    score_9_count = score_count_field(9)
+    score_10_count = score_count_field(10)
+
+    objects = TitleQuerySet.as_manager()
+    counter_fields = (
+        'rating',
+        'review_count',
+        'score_sum',
+        *(score_field(score) for score in SCORES),
+    )
 
     class Meta:
         verbose_name = 'Произведение'
@@ -92,10 +264,37 @@ class Title(models.Model):
             '-year',
             'name',
         )
+        indexes = (
+            models.Index(fields=('name', 'id'), name='title_name_idx'),
+            models.Index(fields=('rating', 'id'), name='title_rating_idx'),
+            models.Index(fields=('year', 'id'), name='title_year_idx'),
+            models.Index(
+                fields=('review_count', 'id'), name='title_review_count_idx'
+            ),
+        )
 
     def __str__(self):
         return self.name
 
+    @property
+    def decade(self):
+        return self.year // 10 * 10
+
+    @property
+    def score_distribution(self):
+        return {
+            score: getattr(self, score_field(score)) for score in SCORES
+        }
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_facets = (
+            instance.__dict__.get('category_id'),
+            instance.__dict__.get('year'),
+        )
+        return instance
+
 
 class GenreTitle(models.Model):
     genre = models.ForeignKey(
@@ -118,7 +317,39 @@ class GenreTitle(models.Model):
         return f'{self.title} входит в жанр {self.genre}'
 
 
-class Review(models.Model):
+class ReviewQuerySet(models.QuerySet):
+    def latest_per_title(self, title_ids, per_title):
+        """Последние per_title отзывов каждого произведения одним запросом.
+
+        Django 3.2 не умеет фильтровать по оконной функции, поэтому
+        ROW_NUMBER() считается во вложенном запросе.
+        """
+        ranked = (
+            self.filter(title_id__in=title_ids)
+            .annotate(
+                position=models.Window(
+                    expression=RowNumber(),
+                    partition_by=models.F('title_id'),
+                    order_by=(
+                        models.F('pub_date').desc(),
+                        models.F('id').desc(),
+                    ),
+                )
+            )
+            .order_by()
+            .values('id', 'position')
+        )
+        sql, params = ranked.query.sql_with_params()
+        return self.filter(
+            id__in=RawSQL(
+                f'SELECT ranked.id FROM ({sql}) AS ranked '
+                'WHERE ranked.position <= %s',
+                (*params, per_title),
+            )
+        ).order_by('title_id', '-pub_date', '-id')
+
+
+class Review(CounterModel):
     title = models.ForeignKey(
         Title,
         related_name='reviews',
@@ -137,21 +368,44 @@ class Review(models.Model):
         validators=[MinValueValidator(1), MaxValueValidator(10)],
     )
     pub_date = models.DateTimeField(auto_now_add=True, verbose_name='Дата')
+    comment_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        verbose_name='Количество комментариев',
+    )
+
+    objects = ReviewQuerySet.as_manager()
+    counter_fields = ('comment_count',)
 
     class Meta:
         verbose_name = 'Отзыв'
         verbose_name_plural = 'Отзывы'
+        ordering = ('-pub_date', '-id')
         constraints = (
             models.UniqueConstraint(
                 fields=('title', 'author'), name='unique_review'
             ),
         )
+        indexes = (
+            models.Index(
+                fields=('title', 'pub_date', 'id'), name='review_feed_idx'
+            ),
+        )
 
     def __str__(self):
         return f'{self.text}'
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_rating = (
+            instance.__dict__.get('title_id'),
+            instance.__dict__.get('score'),
+        )
+        return instance
 
-class Comment(models.Model):
+
+class Comment(CounterModel):
     review = models.ForeignKey(
         Review,
         on_delete=models.CASCADE,
@@ -170,6 +424,120 @@ class Comment(models.Model):
     class Meta:
         verbose_name = 'Комментарий'
         verbose_name_plural = 'Комментарии'
+        ordering = ('-pub_date', '-id')
+        indexes = (
+            models.Index(
+                fields=('review', 'pub_date', 'id'), name='comment_feed_idx'
+            ),
+        )
 
     def __str__(self):
         return f'{self.text}'[:LENGTH_COMMENT]
+
+
+class FacetCounter(models.Model):
+    count = models.PositiveIntegerField(
+        default=0,
+        verbose_name='Количество произведений',
+    )
+
+    class Meta:
+        abstract = True
+
+    @classmethod
+    def shift(cls, key, delta):
+        """Сдвигает счётчик фасета, создавая его при первом произведении."""
+        if key is None or not delta:
+            return
+        counter = cls.objects.filter(pk=key)
+        if counter.update(count=models.F('count') + delta) or delta < 0:
+            return
+        try:
+            with transaction.atomic():
+                cls.objects.create(pk=key, count=delta)
+        except IntegrityError:
+            counter.update(count=models.F('count') + delta)
+
+    @classmethod
+    def counts(cls, key_field):
+        return dict(
+            cls.objects.filter(count__gt=0).values_list(key_field, 'count')
+        )
+
+
+class GenreFacet(FacetCounter):
+    genre = models.OneToOneField(
+        Genre,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='facet',
+        verbose_name='Жанр',
+    )
+
+    class Meta:
+        verbose_name = 'Фасет жанра'
+        verbose_name_plural = 'Фасеты жанров'
+
+    def __str__(self):
+        return f'{self.genre}: {self.count}'
+
+
+class CategoryFacet(FacetCounter):
+    category = models.OneToOneField(
+        Category,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='facet',
+        verbose_name='Категория',
+    )
+
+    class Meta:
+        verbose_name = 'Фасет категории'
+        verbose_name_plural = 'Фасеты категорий'
+
+    def __str__(self):
+        return f'{self.category}: {self.count}'
+
+
+class DecadeFacet(FacetCounter):
+    decade = models.PositiveIntegerField(
+        primary_key=True,
+        verbose_name='Десятилетие',
+    )
+
+    class Meta:
+        verbose_name = 'Фасет десятилетия'
+        verbose_name_plural = 'Фасеты десятилетий'
+
+    def __str__(self):
+        return f'{self.decade}: {self.count}'
+
+
+def stored_facets():
+    """Фасеты всего каталога из предрассчитанных счётчиков."""
+    return {
+        'genre': GenreFacet.counts('genre__slug'),
+        'category': CategoryFacet.counts('category__slug'),
+        'decade': DecadeFacet.counts('decade'),
+    }
+
+
+class DirtyTitle(models.Model):
+    """Отметка о том, что рейтинг произведения нужно пересчитать.
+
+    Отметки только добавляются, поэтому поток отзывов на одно произведение
+    не конкурирует за его строку. title_id хранится без внешнего ключа:
+    отметка может появиться при каскадном удалении самого произведения.
+    """
+
+    title_id = models.PositiveIntegerField(
+        db_index=True,
+        verbose_name='Произведение',
+    )
+
+    class Meta:
+        verbose_name = 'Отметка пересчёта рейтинга'
+        verbose_name_plural = 'Отметки пересчёта рейтинга'
+
+    def __str__(self):
+        return f'{self.title_id}'
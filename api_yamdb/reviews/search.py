@@ -0,0 +1,78 @@
+"""Полнотекстовый индекс произведений на SQLite FTS5.
+
+На SQLite Django пересоздаёт таблицу reviews_title при изменении её схемы,
+и триггеры синхронизации индекса при этом удаляются. Поэтому каждая
+миграция, меняющая Title, должна заканчиваться операцией
+create_search_triggers().
+"""
+from django.db import migrations
+
+SEARCH_TABLE = 'reviews_title_fts'
+
+CREATE_SEARCH_TABLE = (
+    f"CREATE VIRTUAL TABLE {SEARCH_TABLE} USING fts5("
+    "name, description, content='reviews_title', content_rowid='id', "
+    "tokenize='unicode61 remove_diacritics 2')"
+)
+CREATE_SEARCH_TRIGGERS = (
+    "CREATE TRIGGER reviews_title_fts_insert AFTER INSERT ON reviews_title "
+    "BEGIN "
+    f"INSERT INTO {SEARCH_TABLE}(rowid, name, description) "
+    "VALUES (new.id, new.name, new.description); "
+    "END",
+    "CREATE TRIGGER reviews_title_fts_delete AFTER DELETE ON reviews_title "
+    "BEGIN "
+    f"INSERT INTO {SEARCH_TABLE}({SEARCH_TABLE}, rowid, name, description) "
+    "VALUES ('delete', old.id, old.name, old.description); "
+    "END",
+    "CREATE TRIGGER reviews_title_fts_update "
+    "AFTER UPDATE OF name, description ON reviews_title "
+    "BEGIN "
+    f"INSERT INTO {SEARCH_TABLE}({SEARCH_TABLE}, rowid, name, description) "
+    "VALUES ('delete', old.id, old.name, old.description); "
+    f"INSERT INTO {SEARCH_TABLE}(rowid, name, description) "
+    "VALUES (new.id, new.name, new.description); "
+    "END",
+)
+DROP_SEARCH_TRIGGERS = (
+    'DROP TRIGGER IF EXISTS reviews_title_fts_update',
+    'DROP TRIGGER IF EXISTS reviews_title_fts_delete',
+    'DROP TRIGGER IF EXISTS reviews_title_fts_insert',
+)
+REBUILD_SEARCH_TABLE = (
+    f"INSERT INTO {SEARCH_TABLE}({SEARCH_TABLE}) VALUES ('rebuild')"
+)
+DROP_SEARCH_TABLE = f'DROP TABLE IF EXISTS {SEARCH_TABLE}'
+
+
+def run_sqlite(*statements):
+    def run(apps, schema_editor):
+        if schema_editor.connection.vendor != 'sqlite':
+            return
+        for statement in statements:
+            schema_editor.execute(statement)
+
+    return run
+
+
+def create_search_index():
+    return migrations.RunPython(
+        run_sqlite(
+            CREATE_SEARCH_TABLE,
+            *CREATE_SEARCH_TRIGGERS,
+            REBUILD_SEARCH_TABLE,
+        ),
+        run_sqlite(*DROP_SEARCH_TRIGGERS, DROP_SEARCH_TABLE),
+    )
+
+
+def create_search_triggers():
+    """Восстанавливает триггеры после пересоздания reviews_title."""
+    return migrations.RunPython(
+        run_sqlite(
+            *DROP_SEARCH_TRIGGERS,
+            *CREATE_SEARCH_TRIGGERS,
+            REBUILD_SEARCH_TABLE,
+        ),
+        run_sqlite(*DROP_SEARCH_TRIGGERS, *CREATE_SEARCH_TRIGGERS),
+    )
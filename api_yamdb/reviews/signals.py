@@ -0,0 +1,187 @@
+from collections import Counter
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Avg, Count, F, FloatField, Max, Q, Sum, Value
+from django.db.models.functions import Cast, NullIf
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import Signal, receiver
+
+from .models import (
+    SCORES,
+    CategoryFacet,
+    Comment,
+    DecadeFacet,
+    DirtyTitle,
+    GenreFacet,
+    GenreTitle,
+    Review,
+    Title,
+    score_field,
+)
+
+ratings_recalculated = Signal()
+
+
+def update_title_rating(title_id, added=(), removed=()):
+    """Учитывает добавленные и удалённые оценки одним UPDATE."""
+    review_count = F('review_count') + len(added) - len(removed)
+    score_sum = F('score_sum') + sum(added) - sum(removed)
+    histogram = Counter(score for score in added if score in SCORES)
+    histogram.subtract(score for score in removed if score in SCORES)
+    Title.objects.filter(pk=title_id).update(
+        review_count=review_count,
+        score_sum=score_sum,
+        rating=(
+            Cast(score_sum, FloatField())
+            / NullIf(review_count, Value(0))
+        ),
+        **{
+            score_field(score): F(score_field(score)) + delta
+            for score, delta in histogram.items()
+            if delta
+        },
+    )
+
+
+def recalculate_title_rating(title_id):
+    """Пересчитывает рейтинг произведения по всем его отзывам."""
+    aggregate = Review.objects.filter(title_id=title_id).aggregate(
+        review_count=Count('id'),
+        score_sum=Sum('score'),
+        rating=Avg('score'),
+        **{
+            score_field(score): Count('id', filter=Q(score=score))
+            for score in SCORES
+        },
+    )
+    aggregate['score_sum'] = aggregate['score_sum'] or 0
+    Title.objects.filter(pk=title_id).update(**aggregate)
+
+
+def mark_titles_dirty(*title_ids):
+    """Откладывает пересчёт рейтинга до flush_dirty_titles."""
+    DirtyTitle.objects.bulk_create(
+        DirtyTitle(title_id=title_id) for title_id in set(title_ids)
+    )
+
+
+def flush_dirty_titles(batch_size=None):
+    """Пересчитывает рейтинг помеченных произведений пачкой.
+
+    Удаляются только отметки, сделанные до начала пересчёта: отзывы,
+    пришедшие во время него, попадут в следующую пачку. Возвращает число
+    пересчитанных произведений.
+    """
+    batch_size = batch_size or settings.RATING_FLUSH_BATCH_SIZE
+    last_id = DirtyTitle.objects.aggregate(last_id=Max('id'))['last_id']
+    if last_id is None:
+        return 0
+    markers = DirtyTitle.objects.filter(id__lte=last_id)
+    title_ids = list(
+        markers.order_by('title_id')
+        .values_list('title_id', flat=True)
+        .distinct()[:batch_size]
+    )
+    with transaction.atomic():
+        for title_id in title_ids:
+            recalculate_title_rating(title_id)
+        markers.filter(title_id__in=title_ids).delete()
+    ratings_recalculated.send(sender=Title, title_ids=title_ids)
+    return len(title_ids)
+
+
+@receiver(post_save, sender=Review)
+def review_saved(sender, instance, created, **kwargs):
+    loaded = getattr(instance, '_loaded_rating', None)
+    if settings.RATING_BUFFERED:
+        if loaded != (instance.title_id, instance.score):
+            mark_titles_dirty(instance.title_id, *(loaded or ())[:1])
+    elif created:
+        update_title_rating(instance.title_id, added=(instance.score,))
+    elif loaded is None:
+        recalculate_title_rating(instance.title_id)
+    else:
+        old_title_id, old_score = loaded
+        if old_title_id != instance.title_id:
+            update_title_rating(old_title_id, removed=(old_score,))
+            update_title_rating(instance.title_id, added=(instance.score,))
+        elif old_score != instance.score:
+            update_title_rating(
+                instance.title_id,
+                added=(instance.score,),
+                removed=(old_score,),
+            )
+    instance._loaded_rating = (instance.title_id, instance.score)
+
+
+@receiver(post_delete, sender=Review)
+def review_deleted(sender, instance, **kwargs):
+    if settings.RATING_BUFFERED:
+        mark_titles_dirty(instance.title_id)
+        return
+    update_title_rating(instance.title_id, removed=(instance.score,))
+
+
+@receiver(post_save, sender=Comment)
+def comment_saved(sender, instance, created, **kwargs):
+    if created:
+        Review.objects.filter(pk=instance.review_id).update(
+            comment_count=F('comment_count') + 1
+        )
+
+
+@receiver(post_delete, sender=Comment)
+def comment_deleted(sender, instance, **kwargs):
+    Review.objects.filter(pk=instance.review_id).update(
+        comment_count=F('comment_count') - 1
+    )
+
+
+def decade_of(year):
+    return None if year is None else year // 10 * 10
+
+
+@receiver(post_save, sender=Title)
+def title_saved(sender, instance, created, **kwargs):
+    loaded = getattr(instance, '_loaded_facets', None)
+    if not created and loaded is None:
+        return
+    old_category_id, old_year = (None, None) if created else loaded
+    if old_category_id != instance.category_id:
+        CategoryFacet.shift(old_category_id, -1)
+        CategoryFacet.shift(instance.category_id, 1)
+    if decade_of(old_year) != instance.decade:
+        DecadeFacet.shift(decade_of(old_year), -1)
+        DecadeFacet.shift(instance.decade, 1)
+    instance._loaded_facets = (instance.category_id, instance.year)
+
+
+@receiver(post_delete, sender=Title)
+def title_deleted(sender, instance, **kwargs):
+    CategoryFacet.shift(instance.category_id, -1)
+    DecadeFacet.shift(instance.decade, -1)
+
+
+@receiver(post_save, sender=GenreTitle)
+def genre_title_saved(sender, instance, created, **kwargs):
+    if created:
+        GenreFacet.shift(instance.genre_id, 1)
+
+
+@receiver(post_delete, sender=GenreTitle)
+def genre_title_deleted(sender, instance, **kwargs):
+    GenreFacet.shift(instance.genre_id, -1)
+
+
+@receiver(m2m_changed, sender=Title.genre.through)
+def title_genres_added(sender, instance, action, reverse, pk_set, **kwargs):
+    """Учитывает add(): связи создаются bulk_create без post_save.
+
+    remove() и clear() удаляют GenreTitle через QuerySet.delete(),
+    поэтому их учитывает genre_title_deleted.
+    """
+    if action != 'post_add':
+        return
+    for pk in pk_set:
+        GenreFacet.shift(instance.pk if reverse else pk, 1)
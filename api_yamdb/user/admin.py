@@ -1,6 +1,6 @@
 from django.contrib import admin
 
-from .models import User
+from .models import QueuedEmail, User
 
 
 @admin.register(User)
@@ -20,3 +20,12 @@ class UserAdmin(admin.ModelAdmin):
     list_editable = ('role',)
     list_filter = ('username',)
     search_fields = ('username', 'role')
+
+
+@admin.register(QueuedEmail)
+class QueuedEmailAdmin(admin.ModelAdmin):
+    """Класс настройки раздела очереди писем."""
+
+    list_display = ('pk', 'recipient', 'subject', 'attempts',
+                    'next_attempt_at')
+    search_fields = ('recipient',)
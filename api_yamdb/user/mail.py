@@ -0,0 +1,83 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.utils import timezone
+
+from .models import QueuedEmail
+
+
+def queue_mail(subject, message, recipient):
+    """Сохраняет письмо в очередь, не обращаясь к почтовому серверу."""
+    return QueuedEmail.objects.create(
+        subject=subject,
+        message=message,
+        from_email=settings.DEFAULT_FROM_EMAIL,
+        recipient=recipient,
+        next_attempt_at=timezone.now(),
+    )
+
+
+def retry_delay(attempts):
+    """Пауза перед повторной отправкой, удваивается с каждой попыткой."""
+    return timedelta(
+        seconds=settings.EMAIL_QUEUE_RETRY_DELAY * 2 ** (attempts - 1)
+    )
+
+
+def defer(email, error, now):
+    """Откладывает письмо после неудачной попытки."""
+    email.attempts += 1
+    email.last_error = repr(error)
+    email.next_attempt_at = (
+        now + retry_delay(email.attempts)
+        if email.attempts < settings.EMAIL_QUEUE_MAX_ATTEMPTS
+        else None
+    )
+    email.save(update_fields=('attempts', 'last_error', 'next_attempt_at'))
+
+
+def send_queued_mail(batch_size=None):
+    """Отправляет пачку писем, срок которых подошёл, одним соединением.
+
+    Отправленные письма удаляются из очереди. После неудачи попытка
+    откладывается, а после EMAIL_QUEUE_MAX_ATTEMPTS неудач письмо остаётся
+    в очереди без next_attempt_at для разбора вручную. Рассчитано на один
+    процесс-отправитель. Возвращает число обработанных писем.
+    """
+    batch_size = batch_size or settings.EMAIL_QUEUE_BATCH_SIZE
+    now = timezone.now()
+    emails = list(
+        QueuedEmail.objects.filter(next_attempt_at__lte=now).order_by(
+            'next_attempt_at', 'id'
+        )[:batch_size]
+    )
+    if not emails:
+        return 0
+    sent_ids = []
+    connection = get_connection()
+    try:
+        connection.open()
+    except Exception as error:
+        for email in emails:
+            defer(email, error, now)
+        return len(emails)
+    try:
+        for email in emails:
+            message = EmailMessage(
+                email.subject,
+                email.message,
+                email.from_email,
+                [email.recipient],
+                connection=connection,
+            )
+            try:
+                connection.send_messages([message])
+            except Exception as error:
+                defer(email, error, now)
+            else:
+                sent_ids.append(email.id)
+    finally:
+        connection.close()
+        QueuedEmail.objects.filter(id__in=sent_ids).delete()
+    return len(emails)
@@ -0,0 +1,46 @@
+import time
+
+from django.conf import settings
+from django.core.management import BaseCommand
+
+from user.mail import send_queued_mail
+
+
+class Command(BaseCommand):
+    help = 'Отправляет письма из очереди с повторами при ошибках.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='Отправить письма, срок которых подошёл, и завершиться.',
+        )
+        parser.add_argument(
+            '--interval',
+            type=float,
+            default=settings.EMAIL_QUEUE_INTERVAL,
+            help='Пауза между проверками очереди в секундах.',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=settings.EMAIL_QUEUE_BATCH_SIZE,
+            help='Сколько писем отправлять за раз.',
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        while True:
+            started = time.monotonic()
+            sent = total = send_queued_mail(batch_size)
+            while sent == batch_size:
+                sent = send_queued_mail(batch_size)
+                total += sent
+            if total and options['verbosity'] > 1:
+                self.stdout.write(
+                    f'Обработано писем: {total} за '
+                    f'{time.monotonic() - started:.3f} с'
+                )
+            if options['once']:
+                return
+            time.sleep(options['interval'])
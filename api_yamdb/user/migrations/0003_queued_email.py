@@ -0,0 +1,68 @@
+# Generated by Django 3.2 on 2026-10-18 17:29
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('user', '0002_user_confirmation_code'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='QueuedEmail',
+            fields=[
+                (
+                    'id',
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name='ID',
+                    ),
+                ),
+                (
+                    'subject',
+                    models.CharField(max_length=255, verbose_name='Тема'),
+                ),
+                ('message', models.TextField(verbose_name='Текст')),
+                (
+                    'from_email',
+                    models.CharField(
+                        max_length=254, verbose_name='Отправитель'
+                    ),
+                ),
+                (
+                    'recipient',
+                    models.EmailField(
+                        max_length=254, verbose_name='Получатель'
+                    ),
+                ),
+                (
+                    'attempts',
+                    models.PositiveSmallIntegerField(
+                        default=0, verbose_name='Попытки'
+                    ),
+                ),
+                (
+                    'next_attempt_at',
+                    models.DateTimeField(
+                        db_index=True,
+                        null=True,
+                        verbose_name='Следующая попытка',
+                    ),
+                ),
+                (
+                    'last_error',
+                    models.TextField(
+                        blank=True, verbose_name='Последняя ошибка'
+                    ),
+                ),
+            ],
+            options={
+                'verbose_name': 'Письмо в очереди',
+                'verbose_name_plural': 'Письма в очереди',
+                'ordering': ('id',),
+            },
+        ),
+    ]
@@ -43,3 +43,25 @@ class User(AbstractUser):
     @property
     def is_user(self):
         return self.role == USER
+
+
+class QueuedEmail(models.Model):
+    """Письмо, ожидающее отправки командой send_queued_mail."""
+
+    subject = models.CharField('Тема', max_length=255)
+    message = models.TextField('Текст')
+    from_email = models.CharField('Отправитель', max_length=254)
+    recipient = models.EmailField('Получатель', max_length=254)
+    attempts = models.PositiveSmallIntegerField('Попытки', default=0)
+    next_attempt_at = models.DateTimeField(
+        'Следующая попытка', null=True, db_index=True
+    )
+    last_error = models.TextField('Последняя ошибка', blank=True)
+
+    class Meta:
+        verbose_name = 'Письмо в очереди'
+        verbose_name_plural = 'Письма в очереди'
+        ordering = ('id',)
+
+    def __str__(self):
+        return f'{self.recipient}: {self.subject}'
@@ -0,0 +1,78 @@
+from http import HTTPStatus
+
+import pytest
+
+from tests.utils import create_single_review, create_titles
+
+
+@pytest.mark.django_db(transaction=True)
+class Test08TitleRating:
+
+    TITLE_DETAIL_URL_TEMPLATE = '/api/v1/titles/{title_id}/'
+    REVIEW_DETAIL_URL_TEMPLATE = (
+        '/api/v1/titles/{title_id}/reviews/{review_id}/'
+    )
+
+    def get_title(self, client, title_id):
+        response = client.get(
+            self.TITLE_DETAIL_URL_TEMPLATE.format(title_id=title_id)
+        )
+        assert response.status_code == HTTPStatus.OK
+        return response.json()
+
+    def test_01_rating_follows_review_changes(self, client, admin_client,
+                                              user_client, moderator_client):
+        from reviews.models import Title
+
+        titles, _, _ = create_titles(admin_client)
+        title_id = titles[0]['id']
+        review = create_single_review(user_client, title_id, 'qwerty', 3)
+        create_single_review(moderator_client, title_id, 'qwerty', 8)
+
+        title = Title.objects.get(pk=title_id)
+        assert (title.review_count, title.score_sum) == (2, 11), (
+            'Проверьте, что при создании отзыва у произведения '
+            'увеличиваются поля `review_count` и `score_sum`.'
+        )
+        assert self.get_title(client, title_id)['rating'] == 5
+
+        user_client.patch(
+            self.REVIEW_DETAIL_URL_TEMPLATE.format(
+                title_id=title_id, review_id=review.json()['id']
+            ),
+            data={'score': 10}
+        )
+        title.refresh_from_db()
+        assert (title.review_count, title.score_sum) == (2, 18), (
+            'Проверьте, что при изменении оценки отзыва пересчитывается '
+            'сумма оценок произведения.'
+        )
+        assert self.get_title(client, title_id)['rating'] == 9
+
+        user_client.delete(
+            self.REVIEW_DETAIL_URL_TEMPLATE.format(
+                title_id=title_id, review_id=review.json()['id']
+            )
+        )
+        title.refresh_from_db()
+        assert (title.review_count, title.score_sum) == (1, 8)
+        assert title.rating == 8
+
+    def test_02_rating_follows_cascade_delete(self, client, admin_client,
+                                              user, user_client):
+        from reviews.models import Title
+
+        titles, _, _ = create_titles(admin_client)
+        title_id = titles[0]['id']
+        create_single_review(user_client, title_id, 'qwerty', 7)
+        user.delete()
+
+        title = Title.objects.get(pk=title_id)
+        assert (title.review_count, title.score_sum) == (0, 0), (
+            'Проверьте, что при каскадном удалении отзывов счётчики '
+            'рейтинга произведения уменьшаются.'
+        )
+        assert self.get_title(client, title_id)['rating'] is None, (
+            'Если у произведения не осталось отзывов - значением поля '
+            '`rating` должно быть `None`.'
+        )
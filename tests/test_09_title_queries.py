@@ -0,0 +1,56 @@
+import pytest
+
+# Бюджет запросов на чтение произведений анонимным пользователем:
+# список - COUNT для пагинации, выборка с категориями, жанры одним запросом;
+# детальная страница - выборка с категорией и жанры одним запросом.
+TITLES_LIST_QUERIES = 3
+TITLES_DETAIL_QUERIES = 2
+
+
+def create_catalog(size):
+    from reviews.models import Category, Genre, Title
+
+    genres = [
+        Genre.objects.create(name=f'Жанр {idx}', slug=f'genre-{idx}')
+        for idx in range(3)
+    ]
+    titles = []
+    for idx in range(size):
+        category = Category.objects.create(
+            name=f'Категория {idx}', slug=f'category-{idx}'
+        )
+        title = Title.objects.create(
+            name=f'Произведение {idx}',
+            year=2000,
+            description='',
+            category=category,
+        )
+        title.genre.set(genres[:2])
+        titles.append(title)
+    return titles
+
+
+@pytest.mark.django_db(transaction=True)
+class Test09TitleQueries:
+
+    TITLES_URL = '/api/v1/titles/'
+    TITLES_DETAIL_URL_TEMPLATE = '/api/v1/titles/{title_id}/'
+
+    @pytest.mark.parametrize('size', (1, 5, 12))
+    def test_01_titles_list_queries(self, client, django_assert_num_queries,
+                                    size):
+        create_catalog(size)
+        with django_assert_num_queries(TITLES_LIST_QUERIES):
+            response = client.get(self.TITLES_URL, {'page': 1})
+        assert response.json()['results'][0]['genre'], (
+            f'Проверьте, что ответ на GET-запрос к `{self.TITLES_URL}` '
+            'содержит жанры произведений.'
+        )
+
+    def test_02_titles_detail_queries(self, client,
+                                      django_assert_num_queries):
+        title = create_catalog(1)[0]
+        with django_assert_num_queries(TITLES_DETAIL_QUERIES):
+            client.get(self.TITLES_DETAIL_URL_TEMPLATE.format(
+                title_id=title.id
+            ))
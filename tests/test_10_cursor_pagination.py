@@ -0,0 +1,184 @@
+from base64 import b64decode
+from http import HTTPStatus
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from tests.utils import create_titles
+
+
+@pytest.mark.django_db(transaction=True)
+class Test10CursorPagination:
+
+    REVIEWS_URL_TEMPLATE = '/api/v1/titles/{title_id}/reviews/'
+
+    def test_01_reviews_cursor_pages(self, client, admin_client,
+                                     django_user_model):
+        from reviews.models import Review
+
+        titles, _, _ = create_titles(admin_client)
+        for idx in range(12):
+            author = django_user_model.objects.create_user(
+                username=f'author{idx}', email=f'author{idx}@yamdb.fake'
+            )
+            Review.objects.create(
+                title_id=titles[0]['id'], author=author, text='text', score=5
+            )
+        url = self.REVIEWS_URL_TEMPLATE.format(title_id=titles[0]['id'])
+
+        response = client.get(url, {'pagination': 'cursor'})
+        assert response.status_code == HTTPStatus.OK
+        data = response.json()
+        assert 'count' not in data, (
+            'Проверьте, что в курсорном режиме пагинации ответ на '
+            f'GET-запрос к `{self.REVIEWS_URL_TEMPLATE}` не содержит '
+            'общего количества объектов.'
+        )
+        seen = [review['id'] for review in data['results']]
+        while data['next']:
+            data = client.get(data['next']).json()
+            seen.extend(review['id'] for review in data['results'])
+
+        expected = list(
+            Review.objects.order_by('-pub_date', '-id').values_list(
+                'id', flat=True
+            )
+        )
+        assert seen == expected, (
+            'Проверьте, что курсорная пагинация отзывов возвращает каждый '
+            'отзыв ровно один раз, от новых к старым.'
+        )
+
+    TITLES_URL = '/api/v1/titles/'
+
+    def walk(self, client, params):
+        data = client.get(self.TITLES_URL, params).json()
+        pages = [data]
+        while data['next']:
+            assert 'o=' not in b64decode(
+                parse_qs(urlsplit(data['next']).query)['cursor'][0]
+            ).decode(), (
+                'Проверьте, что курсор произведений не использует смещение.'
+            )
+            data = client.get(data['next']).json()
+            pages.append(data)
+        return pages
+
+    @pytest.mark.parametrize('ordering', (None, '-rating', 'rating'))
+    def test_02_titles_cursor_pages(self, client, ordering):
+        from reviews.models import Title
+
+        ratings = (None, 7.5, None, 3.0, 7.5, None, 9.0, 3.0, None, None,
+                   7.5, 1.0)
+        for rating in ratings:
+            Title.objects.create(
+                name='Произведение', year=2000, description='',
+                rating=rating,
+            )
+        params = {'pagination': 'cursor'}
+        if ordering:
+            params['ordering'] = ordering
+        pages = self.walk(client, params)
+        seen = [title['id'] for page in pages for title in page['results']]
+
+        rows = list(Title.objects.values_list('id', 'rating'))
+        if ordering is None:
+            expected = sorted(rows, key=lambda row: -row[0])
+        else:
+            sign = -1 if ordering.startswith('-') else 1
+            expected = sorted(
+                rows,
+                key=lambda row: (
+                    sign * (row[1] is not None),
+                    sign * (row[1] or 0),
+                    sign * row[0],
+                ),
+            )
+        assert seen == [row[0] for row in expected], (
+            f'Проверьте, что курсорная пагинация `{self.TITLES_URL}` '
+            'возвращает каждое произведение ровно один раз в порядке '
+            'сортировки, в том числе без оценок.'
+        )
+
+        data = pages[-1]
+        back = [title['id'] for title in data['results']]
+        while data['previous']:
+            data = client.get(data['previous']).json()
+            back = [title['id'] for title in data['results']] + back
+        assert back == seen, (
+            'Проверьте, что ссылки previous проходят страницы в обратном '
+            'порядке без пропусков.'
+        )
+
+    @pytest.mark.parametrize(
+        'ordering',
+        (None, '-rating', 'rating', 'name', '-year', 'review_count'),
+    )
+    def test_03_titles_cursor_pages_use_index(self, client, ordering):
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        from reviews.models import Title
+
+        for index in range(12):
+            Title.objects.create(
+                name=f'Произведение {index}', year=2000, description='',
+                rating=None if index % 3 else index,
+            )
+        params = {'pagination': 'cursor'}
+        if ordering:
+            params['ordering'] = ordering
+        data = client.get(self.TITLES_URL, params).json()
+        while data['next']:
+            with CaptureQueriesContext(connection) as context:
+                data = client.get(data['next']).json()
+            for query in context.captured_queries:
+                if 'FROM "reviews_title"' not in query['sql']:
+                    continue
+                with connection.cursor() as cursor:
+                    cursor.execute(f'EXPLAIN QUERY PLAN {query["sql"]}')
+                    plan = [row[-1] for row in cursor.fetchall()]
+                assert any(
+                    step.startswith('SEARCH reviews_title') for step in plan
+                ) and not any(
+                    step.startswith('SCAN') or 'TEMP B-TREE' in step
+                    for step in plan
+                ), (
+                    'Проверьте, что страница курсорной пагинации '
+                    f'произведений ищется по индексу, а не сканирует '
+                    f'таблицу: {plan}'
+                )
+
+    @pytest.mark.parametrize('ordering, position', (
+        (None, '["abc"]'),
+        (None, '[{"a": 1}]'),
+        (None, '[null]'),
+        (None, '[100000000000000000000000]'),
+        ('-rating', '[NaN, 1]'),
+        ('-rating', '["abc", 1]'),
+        ('-rating', '[1.0]'),
+        ('-year', '[null, 1]'),
+        ('name', '[["a"], 1]'),
+    ))
+    def test_04_invalid_title_cursor(self, client, ordering, position):
+        from base64 import b64encode
+        from urllib.parse import urlencode
+
+        params = {
+            'pagination': 'cursor',
+            'cursor': b64encode(urlencode({'p': position}).encode()).decode(),
+        }
+        if ordering:
+            params['ordering'] = ordering
+        response = client.get(self.TITLES_URL, params)
+        assert response.status_code == HTTPStatus.NOT_FOUND, (
+            'Проверьте, что некорректный курсор произведений приводит к '
+            'ответу со статусом 404, а не к ошибке сервера.'
+        )
+
+    def test_05_title_cursor_single_ordering_field(self, client):
+        response = client.get(
+            self.TITLES_URL,
+            {'pagination': 'cursor', 'ordering': 'year,name'},
+        )
+        assert response.status_code == HTTPStatus.BAD_REQUEST
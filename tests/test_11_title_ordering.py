@@ -0,0 +1,41 @@
+from http import HTTPStatus
+
+import pytest
+
+from tests.utils import create_single_review, create_titles
+
+
+@pytest.mark.django_db(transaction=True)
+class Test11TitleOrdering:
+
+    TITLES_URL = '/api/v1/titles/'
+
+    @pytest.mark.parametrize(
+        'ordering, index', (
+            ('-rating', 'title_rating_idx'),
+            ('-year', 'title_year_idx'),
+            ('-review_count', 'title_review_count_idx'),
+        )
+    )
+    def test_01_titles_ordering(self, client, admin_client, user_client,
+                                moderator_client, ordering, index):
+        from reviews.models import Title
+
+        titles, _, _ = create_titles(admin_client)
+        create_single_review(user_client, titles[0]['id'], 'text', 2)
+        create_single_review(user_client, titles[1]['id'], 'text', 9)
+        create_single_review(moderator_client, titles[1]['id'], 'text', 9)
+
+        response = client.get(self.TITLES_URL, {'ordering': ordering})
+        assert response.status_code == HTTPStatus.OK
+        result = [title['id'] for title in response.json()['results']]
+        assert result == [titles[1]['id'], titles[0]['id']], (
+            f'Проверьте, что GET-запрос к `{self.TITLES_URL}` с параметром '
+            f'`ordering={ordering}` возвращает отсортированные произведения.'
+        )
+
+        plan = Title.objects.order_by(ordering, '-id')[:5].explain()
+        assert index in plan, (
+            f'Проверьте, что сортировка `{ordering}` использует индекс '
+            f'`{index}`.'
+        )
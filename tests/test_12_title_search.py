@@ -0,0 +1,67 @@
+from http import HTTPStatus
+
+import pytest
+
+from tests.utils import create_titles
+
+
+@pytest.mark.django_db(transaction=True)
+class Test12TitleSearch:
+
+    TITLES_URL = '/api/v1/titles/'
+    TITLES_DETAIL_URL_TEMPLATE = '/api/v1/titles/{title_id}/'
+
+    def search(self, client, query):
+        response = client.get(self.TITLES_URL, {'search': query})
+        assert response.status_code == HTTPStatus.OK
+        return [title['id'] for title in response.json()['results']]
+
+    def test_01_search_name_and_description(self, client, admin_client):
+        titles, _, _ = create_titles(admin_client)
+
+        assert self.search(client, 'орешек') == [titles[1]['id']], (
+            f'Проверьте, что GET-запрос к `{self.TITLES_URL}` с параметром '
+            '`search` находит произведения по названию без учёта регистра.'
+        )
+        assert self.search(client, 'back') == [titles[0]['id']], (
+            f'Проверьте, что GET-запрос к `{self.TITLES_URL}` с параметром '
+            '`search` находит произведения по описанию.'
+        )
+        assert self.search(client, 'терминат') == [titles[0]['id']]
+        assert self.search(client, '"(AND') == []
+
+    def test_02_search_index_follows_changes(self, client, admin_client):
+        titles, _, _ = create_titles(admin_client)
+        url = self.TITLES_DETAIL_URL_TEMPLATE.format(title_id=titles[0]['id'])
+
+        admin_client.patch(url, data={'name': 'Чужой'})
+        assert self.search(client, 'терминатор') == [], (
+            'Проверьте, что поисковый индекс обновляется при изменении '
+            'произведения.'
+        )
+        assert self.search(client, 'чужой') == [titles[0]['id']]
+
+        admin_client.delete(url)
+        assert self.search(client, 'чужой') == [], (
+            'Проверьте, что поисковый индекс обновляется при удалении '
+            'произведения.'
+        )
+
+    def test_03_search_with_cursor_pagination(self, client, admin_client):
+        titles, _, _ = create_titles(admin_client)
+
+        response = client.get(
+            self.TITLES_URL, {'search': 'орешек', 'pagination': 'cursor'}
+        )
+        assert response.status_code == HTTPStatus.BAD_REQUEST, (
+            'Проверьте, что курсорная пагинация не подменяет порядок '
+            'результатов поиска по релевантности.'
+        )
+
+        response = client.get(self.TITLES_URL, {
+            'search': 'орешек', 'pagination': 'cursor', 'ordering': '-year'
+        })
+        assert response.status_code == HTTPStatus.OK
+        assert [
+            title['id'] for title in response.json()['results']
+        ] == [titles[1]['id']]
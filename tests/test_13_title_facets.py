@@ -0,0 +1,72 @@
+from http import HTTPStatus
+
+import pytest
+
+from tests.utils import create_titles
+
+
+@pytest.mark.django_db(transaction=True)
+class Test13TitleFacets:
+
+    FACETS_URL = '/api/v1/titles/facets/'
+    TITLES_DETAIL_URL_TEMPLATE = '/api/v1/titles/{title_id}/'
+
+    def get_facets(self, client, params=None):
+        response = client.get(self.FACETS_URL, params or {})
+        assert response.status_code == HTTPStatus.OK, (
+            f'Проверьте, что GET-запрос к `{self.FACETS_URL}` возвращает '
+            'ответ со статусом 200.'
+        )
+        return response.json()
+
+    def test_01_facets_follow_catalog(self, client, admin_client):
+        titles, _, _ = create_titles(admin_client)
+        expected = {
+            'genre': {'horror': 1, 'comedy': 1, 'drama': 1},
+            'category': {'films': 1, 'books': 1},
+            'decade': {'1980': 2},
+        }
+        assert self.get_facets(client) == expected, (
+            f'Проверьте, что ответ на GET-запрос к `{self.FACETS_URL}` '
+            'содержит количество произведений по жанрам, категориям и '
+            'десятилетиям.'
+        )
+
+        admin_client.patch(
+            self.TITLES_DETAIL_URL_TEMPLATE.format(title_id=titles[0]['id']),
+            data={'genre': ['drama'], 'category': 'books', 'year': 1979}
+        )
+        expected = {
+            'genre': {'drama': 2},
+            'category': {'books': 2},
+            'decade': {'1970': 1, '1980': 1},
+        }
+        assert self.get_facets(client) == expected, (
+            'Проверьте, что счётчики фасетов обновляются при изменении '
+            'произведения.'
+        )
+
+        admin_client.delete(
+            self.TITLES_DETAIL_URL_TEMPLATE.format(title_id=titles[1]['id'])
+        )
+        expected = {
+            'genre': {'drama': 1},
+            'category': {'books': 1},
+            'decade': {'1970': 1},
+        }
+        assert self.get_facets(client) == expected, (
+            'Проверьте, что счётчики фасетов обновляются при удалении '
+            'произведения.'
+        )
+
+    def test_02_facets_with_filter(self, client, admin_client):
+        create_titles(admin_client)
+        expected = {
+            'genre': {'horror': 1, 'comedy': 1},
+            'category': {'films': 1},
+            'decade': {'1980': 1},
+        }
+        assert self.get_facets(client, {'genre': 'comedy'}) == expected, (
+            f'Проверьте, что GET-запрос к `{self.FACETS_URL}` учитывает '
+            'параметры фильтрации произведений.'
+        )
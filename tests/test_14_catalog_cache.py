@@ -0,0 +1,86 @@
+from http import HTTPStatus
+
+import pytest
+
+from tests.utils import create_categories, create_genre
+
+
+@pytest.mark.django_db(transaction=True)
+class Test14CatalogCache:
+
+    @pytest.mark.parametrize(
+        'url, create', (
+            ('/api/v1/categories/', create_categories),
+            ('/api/v1/genres/', create_genre),
+        )
+    )
+    def test_01_cached_list(self, client, admin_client,
+                            django_assert_num_queries, url, create):
+        objects = create(admin_client)
+        response = client.get(url, {'search': objects[0]['name']})
+        assert response.status_code == HTTPStatus.OK
+
+        with django_assert_num_queries(0):
+            cached = client.get(url, {'search': objects[0]['name']})
+        assert cached.json() == response.json(), (
+            f'Проверьте, что повторный GET-запрос к `{url}` отдаёт '
+            'закэшированный ответ без обращения к базе данных.'
+        )
+
+        admin_client.delete(f'{url}{objects[0]["slug"]}/')
+        response = client.get(url, {'search': objects[0]['name']})
+        assert response.json()['count'] == 0, (
+            f'Проверьте, что после изменения данных GET-запрос к `{url}` '
+            'не возвращает устаревший ответ из кэша.'
+        )
+
+    def test_02_cache_key_ignores_unknown_params(self, client, admin_client,
+                                                 django_assert_num_queries):
+        from django.core.cache import caches
+
+        create_genre(admin_client)
+        url = '/api/v1/genres/'
+        client.get(url, {'search': 'а', 'page': 1})
+        with django_assert_num_queries(0):
+            client.get(url, {'page': 1, 'search': 'а'})
+
+        entries = len(caches['default']._cache)
+        for index in range(5):
+            response = client.get(url, {'junk': index})
+            assert response.status_code == HTTPStatus.OK
+        assert len(caches['default']._cache) == entries, (
+            f'Проверьте, что посторонние параметры GET-запроса к `{url}` '
+            'не создают новых записей в кэше.'
+        )
+
+    def test_03_version_changes_after_commit(self, client, admin_client):
+        from django.db import transaction
+
+        from api.cache import get_model_version
+        from reviews.models import Genre
+
+        url = '/api/v1/genres/'
+        client.get(url)
+        version = get_model_version(Genre)
+        with transaction.atomic():
+            Genre.objects.create(name='Драма', slug='drama')
+            assert get_model_version(Genre) == version
+            assert client.get(url).json()['count'] == 0
+        assert get_model_version(Genre) != version, (
+            'Проверьте, что версия таблицы меняется после завершения '
+            'транзакции.'
+        )
+        assert client.get(url).json()['count'] == 1, (
+            f'Проверьте, что GET-запрос к `{url}` во время транзакции не '
+            'оставляет в кэше устаревший ответ под новой версией.'
+        )
+
+    def test_04_local_cache_timeout_is_short(self, settings):
+        from django.core.cache import caches
+
+        assert type(caches['default']).__name__ != 'LocMemCache' or (
+            settings.API_RESPONSE_CACHE_TIMEOUT <= 60
+        ), (
+            'Проверьте, что с кэшем в памяти процесса ответы и версии '
+            'таблиц живут недолго.'
+        )
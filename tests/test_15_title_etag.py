@@ -0,0 +1,64 @@
+from http import HTTPStatus
+
+import pytest
+
+from tests.utils import create_single_review, create_titles
+
+
+@pytest.mark.django_db(transaction=True)
+class Test15TitleETag:
+
+    TITLES_URL = '/api/v1/titles/'
+    TITLES_DETAIL_URL_TEMPLATE = '/api/v1/titles/{title_id}/'
+
+    @pytest.mark.parametrize('detail', (False, True))
+    def test_01_titles_not_modified(self, client, admin_client, user_client,
+                                    django_assert_num_queries, detail):
+        titles, _, _ = create_titles(admin_client)
+        url = self.TITLES_URL
+        if detail:
+            url = self.TITLES_DETAIL_URL_TEMPLATE.format(
+                title_id=titles[0]['id']
+            )
+
+        etag = client.get(url).get('ETag')
+        assert etag and etag.startswith('W/'), (
+            f'Проверьте, что ответ на GET-запрос к `{url}` содержит '
+            'слабый заголовок `ETag`.'
+        )
+        with django_assert_num_queries(0):
+            response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == HTTPStatus.NOT_MODIFIED, (
+            f'Проверьте, что GET-запрос к `{url}` с совпадающим '
+            '`If-None-Match` возвращает ответ со статусом 304 без '
+            'обращения к базе данных.'
+        )
+
+        create_single_review(user_client, titles[0]['id'], 'text', 5)
+        response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == HTTPStatus.OK, (
+            f'Проверьте, что после нового отзыва GET-запрос к `{url}` '
+            'со старым `If-None-Match` возвращает актуальные данные.'
+        )
+
+    def test_02_etag_changes_after_commit(self, client, admin_client, user):
+        from django.db import transaction
+
+        from reviews.models import Review
+
+        titles, _, _ = create_titles(admin_client)
+        url = self.TITLES_DETAIL_URL_TEMPLATE.format(title_id=titles[0]['id'])
+        etag = client.get(url).get('ETag')
+
+        with transaction.atomic():
+            Review.objects.create(
+                title_id=titles[0]['id'], author=user, text='text', score=5
+            )
+            response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+            assert response.status_code == HTTPStatus.NOT_MODIFIED, (
+                'Проверьте, что ETag произведения не меняется до завершения '
+                'транзакции с новым отзывом.'
+            )
+        response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == HTTPStatus.OK
+        assert response.json()['rating'] == 5
@@ -0,0 +1,35 @@
+from http import HTTPStatus
+
+import pytest
+from rest_framework.renderers import JSONRenderer
+
+from tests.utils import create_single_review, create_titles
+
+
+@pytest.mark.django_db(transaction=True)
+class Test16TitleFastList:
+
+    TITLES_URL = '/api/v1/titles/'
+
+    def test_01_list_matches_serializer(self, client, admin_client,
+                                        user_client):
+        from api.serializers import TitleGetSerializer
+        from reviews.models import Title
+
+        titles, _, _ = create_titles(admin_client)
+        create_single_review(user_client, titles[0]['id'], 'text', 7)
+        Title.objects.create(name='Без категории', year=2001, description='')
+
+        response = client.get(self.TITLES_URL, {'ordering': 'name'})
+        assert response.status_code == HTTPStatus.OK
+        queryset = Title.objects.order_by('name', 'id')
+        expected = JSONRenderer().render({
+            'count': 3,
+            'next': None,
+            'previous': None,
+            'results': TitleGetSerializer(queryset, many=True).data,
+        })
+        assert response.content == expected, (
+            f'Проверьте, что ответ на GET-запрос к `{self.TITLES_URL}` '
+            'совпадает с выводом `TitleGetSerializer`.'
+        )
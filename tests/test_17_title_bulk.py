@@ -0,0 +1,112 @@
+from http import HTTPStatus
+
+import pytest
+
+from tests.utils import create_categories, create_genre
+
+
+@pytest.mark.django_db(transaction=True)
+class Test17TitleBulk:
+
+    BULK_URL = '/api/v1/titles/bulk/'
+
+    def test_01_bulk_create(self, client, admin_client,
+                            django_assert_max_num_queries):
+        from reviews.models import GenreTitle, Title
+
+        genres = create_genre(admin_client)
+        categories = create_categories(admin_client)
+        data = [
+            {
+                'name': f'Произведение {idx}',
+                'year': 1990 + idx,
+                'genre': [genres[0]['slug'], genres[idx % 2 + 1]['slug']],
+                'category': categories[idx % 2]['slug'],
+                'description': 'Описание',
+            }
+            for idx in range(20)
+        ]
+        response = admin_client.post(
+            self.BULK_URL, data=data[:2], format='json'
+        )
+        assert response.status_code == HTTPStatus.CREATED, (
+            f'Если POST-запрос администратора к `{self.BULK_URL}` содержит '
+            'корректные данные - должен вернуться ответ со статусом 201.'
+        )
+        result = response.json()
+        with django_assert_max_num_queries(20):
+            response = admin_client.post(
+                self.BULK_URL, data=data[2:], format='json'
+            )
+        assert response.status_code == HTTPStatus.CREATED
+        result.extend(response.json())
+        assert [item['genre'] for item in result] == [
+            item['genre'] for item in data
+        ]
+        assert Title.objects.count() == 20
+        assert GenreTitle.objects.count() == 40
+        for item in result:
+            title = Title.objects.get(pk=item['id'])
+            assert title.name == item['name'], (
+                f'Проверьте, что POST-запрос к `{self.BULK_URL}` возвращает '
+                'id созданных произведений.'
+            )
+
+        facets = client.get('/api/v1/titles/facets/').json()
+        assert facets['genre'] == {'horror': 20, 'comedy': 10, 'drama': 10}
+        assert facets['decade'] == {'1990': 10, '2000': 10}
+
+    def test_02_bulk_errors_per_item(self, admin_client, user_client):
+        from reviews.models import Title
+
+        genres = create_genre(admin_client)
+        categories = create_categories(admin_client)
+        valid = {
+            'name': 'Произведение',
+            'year': 2000,
+            'genre': [genres[0]['slug']],
+            'category': categories[0]['slug'],
+            'description': 'Описание',
+        }
+        invalid = dict(valid, genre=['unknown'], year=3000)
+
+        response = user_client.post(self.BULK_URL, data=[valid], format='json')
+        assert response.status_code == HTTPStatus.FORBIDDEN
+
+        response = admin_client.post(
+            self.BULK_URL, data=[valid, invalid], format='json'
+        )
+        assert response.status_code == HTTPStatus.BAD_REQUEST
+        errors = response.json()
+        assert errors[0] == {} and set(errors[1]) == {'genre', 'year'}, (
+            f'Проверьте, что POST-запрос к `{self.BULK_URL}` возвращает '
+            'ошибки валидации для каждого элемента списка.'
+        )
+        assert not Title.objects.exists()
+
+    def test_02_bulk_size_limit(self, admin_client,
+                                django_assert_max_num_queries):
+        from api.serializers import TITLE_BULK_MAX_ITEMS
+        from reviews.models import Title
+
+        categories = create_categories(admin_client)
+        item = {
+            'name': 'Произведение',
+            'year': 2000,
+            'genre': [],
+            'category': categories[0]['slug'],
+            'description': 'Описание',
+        }
+        # Не больше запроса пользователя: жанры и категории не ищутся.
+        with django_assert_max_num_queries(1):
+            response = admin_client.post(
+                self.BULK_URL,
+                data=[item] * (TITLE_BULK_MAX_ITEMS + 1),
+                format='json',
+            )
+        assert response.status_code == HTTPStatus.BAD_REQUEST, (
+            f'Проверьте, что POST-запрос к `{self.BULK_URL}` с пакетом '
+            f'больше {TITLE_BULK_MAX_ITEMS} произведений возвращает ответ '
+            'со статусом 400.'
+        )
+        assert not Title.objects.exists()
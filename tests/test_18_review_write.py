@@ -0,0 +1,53 @@
+from http import HTTPStatus
+
+import pytest
+
+from tests.utils import create_single_review, create_titles
+
+
+@pytest.mark.django_db(transaction=True)
+class Test18ReviewWrite:
+
+    REVIEWS_URL_TEMPLATE = '/api/v1/titles/{title_id}/reviews/'
+
+    def test_01_review_create_queries(self, admin_client, user_client,
+                                      django_assert_max_num_queries):
+        titles, _, _ = create_titles(admin_client)
+        url = self.REVIEWS_URL_TEMPLATE.format(title_id=titles[0]['id'])
+
+        # Пользователь, произведение, BEGIN, INSERT отзыва, UPDATE рейтинга.
+        with django_assert_max_num_queries(5):
+            create_single_review(user_client, titles[0]['id'], 'text', 5)
+
+        response = user_client.post(url, data={'text': 'text', 'score': 5})
+        assert response.status_code == HTTPStatus.BAD_REQUEST, (
+            f'Проверьте, что повторный POST-запрос к `{url}` от того же '
+            'пользователя возвращает ответ со статусом 400.'
+        )
+
+        response = user_client.post(
+            self.REVIEWS_URL_TEMPLATE.format(title_id=999),
+            data={'text': 'text', 'score': 5}
+        )
+        assert response.status_code == HTTPStatus.NOT_FOUND
+
+    def test_02_only_duplicate_is_reported(self, admin_client, user_client):
+        from unittest import mock
+
+        from django.db import IntegrityError
+
+        titles, _, _ = create_titles(admin_client)
+        url = self.REVIEWS_URL_TEMPLATE.format(title_id=titles[0]['id'])
+        with mock.patch(
+            'reviews.models.Review.save',
+            side_effect=IntegrityError('FOREIGN KEY constraint failed'),
+        ):
+            with pytest.raises(IntegrityError):
+                user_client.post(url, data={'text': 'text', 'score': 5})
+
+        user_client.post(url, data={'text': 'text', 'score': 5})
+        response = user_client.post(url, data={'text': 'text', 'score': 5})
+        assert response.status_code == HTTPStatus.BAD_REQUEST, (
+            'Проверьте, что повторный отзыв на произведение возвращает ответ '
+            'со статусом 400.'
+        )
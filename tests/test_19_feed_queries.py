@@ -0,0 +1,61 @@
+import pytest
+
+# Бюджет запросов на чтение отзывов и комментариев анонимным пользователем:
+# родительский объект, COUNT для пагинации и выборка вместе с авторами.
+FEED_LIST_QUERIES = 3
+FEED_DETAIL_QUERIES = 2
+
+
+def create_feed(size, django_user_model):
+    from reviews.models import Comment, Review, Title
+
+    title = Title.objects.create(name='Произведение', year=2000,
+                                 description='')
+    review = None
+    for idx in range(size):
+        author = django_user_model.objects.create_user(
+            username=f'author{idx}', email=f'author{idx}@yamdb.fake'
+        )
+        review = Review.objects.create(
+            title=title, author=author, text='text', score=5
+        )
+        Comment.objects.create(review=review, author=author, text='text')
+    return title, review
+
+
+@pytest.mark.django_db(transaction=True)
+class Test19FeedQueries:
+
+    REVIEWS_URL_TEMPLATE = '/api/v1/titles/{title_id}/reviews/'
+    COMMENTS_URL_TEMPLATE = (
+        '/api/v1/titles/{title_id}/reviews/{review_id}/comments/'
+    )
+
+    @pytest.mark.parametrize('size', (1, 5))
+    def test_01_reviews_queries(self, client, django_user_model,
+                                django_assert_num_queries, size):
+        title, review = create_feed(size, django_user_model)
+        url = self.REVIEWS_URL_TEMPLATE.format(title_id=title.id)
+        with django_assert_num_queries(FEED_LIST_QUERIES):
+            client.get(url)
+        with django_assert_num_queries(FEED_DETAIL_QUERIES):
+            client.get(f'{url}{review.id}/')
+
+    @pytest.mark.parametrize('size', (1, 5))
+    def test_02_comments_queries(self, client, django_user_model,
+                                 django_assert_num_queries, size):
+        from reviews.models import Comment
+
+        title, review = create_feed(size, django_user_model)
+        Comment.objects.bulk_create(
+            Comment(review=review, author=comment.author, text='text')
+            for comment in Comment.objects.select_related('author')
+        )
+        url = self.COMMENTS_URL_TEMPLATE.format(
+            title_id=title.id, review_id=review.id
+        )
+        comment_id = review.comments.first().id
+        with django_assert_num_queries(FEED_LIST_QUERIES):
+            client.get(url)
+        with django_assert_num_queries(FEED_DETAIL_QUERIES):
+            client.get(f'{url}{comment_id}/')
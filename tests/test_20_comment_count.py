@@ -0,0 +1,55 @@
+import pytest
+
+from tests.utils import create_comments
+
+
+@pytest.mark.django_db(transaction=True)
+class Test20CommentCount:
+
+    REVIEWS_URL_TEMPLATE = '/api/v1/titles/{title_id}/reviews/'
+    COMMENT_DETAIL_URL_TEMPLATE = (
+        '/api/v1/titles/{title_id}/reviews/{review_id}/comments/'
+        '{comment_id}/'
+    )
+
+    def get_counts(self, client, title_id):
+        response = client.get(
+            self.REVIEWS_URL_TEMPLATE.format(title_id=title_id)
+        )
+        return {
+            review['id']: review.get('comment_count')
+            for review in response.json()['results']
+        }
+
+    def test_01_comment_count(self, client, admin_client, admin, user,
+                              user_client, moderator, moderator_client):
+        author_map = {
+            admin: admin_client,
+            user: user_client,
+            moderator: moderator_client
+        }
+        comments, reviews, titles = create_comments(admin_client, author_map)
+        counts = self.get_counts(client, titles[0]['id'])
+        assert counts[reviews[0]['id']] == 3, (
+            'Проверьте, что ответ на GET-запрос к '
+            f'`{self.REVIEWS_URL_TEMPLATE}` содержит количество '
+            'комментариев к отзыву в поле `comment_count`.'
+        )
+        assert counts[reviews[1]['id']] == 0
+
+        response = admin_client.patch(
+            self.REVIEWS_URL_TEMPLATE.format(title_id=titles[0]['id'])
+            + f'{reviews[0]["id"]}/',
+            data={'text': 'new text'}
+        )
+        assert response.json()['comment_count'] == 3
+        admin_client.delete(self.COMMENT_DETAIL_URL_TEMPLATE.format(
+            title_id=titles[0]['id'],
+            review_id=reviews[0]['id'],
+            comment_id=comments[0]['id'],
+        ))
+        counts = self.get_counts(client, titles[0]['id'])
+        assert counts[reviews[0]['id']] == 2, (
+            'Проверьте, что поле `comment_count` уменьшается при удалении '
+            'комментария.'
+        )
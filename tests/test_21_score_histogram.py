@@ -0,0 +1,55 @@
+from http import HTTPStatus
+
+import pytest
+
+from tests.utils import create_single_review, create_titles
+
+
+@pytest.mark.django_db(transaction=True)
+class Test21ScoreHistogram:
+
+    SCORES_URL_TEMPLATE = '/api/v1/titles/{title_id}/scores/'
+    REVIEW_DETAIL_URL_TEMPLATE = (
+        '/api/v1/titles/{title_id}/reviews/{review_id}/'
+    )
+
+    def get_scores(self, client, title_id):
+        response = client.get(
+            self.SCORES_URL_TEMPLATE.format(title_id=title_id)
+        )
+        assert response.status_code == HTTPStatus.OK, (
+            f'Проверьте, что GET-запрос к `{self.SCORES_URL_TEMPLATE}` '
+            'возвращает ответ со статусом 200.'
+        )
+        return {
+            int(score): count for score, count in response.json().items()
+            if count
+        }
+
+    def test_01_histogram_follows_reviews(self, client, admin_client,
+                                          user_client, moderator_client,
+                                          django_assert_num_queries):
+        titles, _, _ = create_titles(admin_client)
+        title_id = titles[0]['id']
+        review = create_single_review(user_client, title_id, 'text', 3)
+        create_single_review(moderator_client, title_id, 'text', 3)
+        create_single_review(admin_client, title_id, 'text', 10)
+
+        with django_assert_num_queries(1):
+            scores = self.get_scores(client, title_id)
+        assert scores == {3: 2, 10: 1}, (
+            f'Проверьте, что ответ на GET-запрос к '
+            f'`{self.SCORES_URL_TEMPLATE}` содержит количество отзывов с '
+            'каждой оценкой.'
+        )
+
+        url = self.REVIEW_DETAIL_URL_TEMPLATE.format(
+            title_id=title_id, review_id=review.json()['id']
+        )
+        user_client.patch(url, data={'score': 7})
+        assert self.get_scores(client, title_id) == {3: 1, 7: 1, 10: 1}
+        user_client.delete(url)
+        assert self.get_scores(client, title_id) == {3: 1, 10: 1}
+
+        response = client.get(self.SCORES_URL_TEMPLATE.format(title_id=999))
+        assert response.status_code == HTTPStatus.NOT_FOUND
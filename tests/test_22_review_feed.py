@@ -0,0 +1,67 @@
+from http import HTTPStatus
+
+import pytest
+
+
+@pytest.mark.django_db(transaction=True)
+class Test22ReviewFeed:
+
+    FEED_URL = '/api/v1/reviews/'
+
+    def test_01_latest_reviews_per_title(self, client, django_user_model,
+                                         django_assert_num_queries):
+        from reviews.models import Review, Title
+
+        titles = [
+            Title.objects.create(name=f'Произведение {idx}', year=2000,
+                                 description='')
+            for idx in range(3)
+        ]
+        for idx in range(5):
+            author = django_user_model.objects.create_user(
+                username=f'author{idx}', email=f'author{idx}@yamdb.fake'
+            )
+            for title in titles[:2]:
+                Review.objects.create(
+                    title=title, author=author, text=f'text {idx}', score=5
+                )
+        title_ids = f'{titles[0].id},{titles[1].id},{titles[2].id}'
+
+        with django_assert_num_queries(1):
+            response = client.get(
+                self.FEED_URL, {'title_ids': title_ids, 'per_title': 2}
+            )
+        assert response.status_code == HTTPStatus.OK, (
+            f'Проверьте, что GET-запрос к `{self.FEED_URL}` возвращает '
+            'ответ со статусом 200.'
+        )
+        result = [
+            (review['title'], review['text'], review['author'])
+            for review in response.json()
+        ]
+        assert result == [
+            (titles[0].id, 'text 4', 'author4'),
+            (titles[0].id, 'text 3', 'author3'),
+            (titles[1].id, 'text 4', 'author4'),
+            (titles[1].id, 'text 3', 'author3'),
+        ], (
+            f'Проверьте, что GET-запрос к `{self.FEED_URL}` возвращает '
+            'последние `per_title` отзывов каждого произведения.'
+        )
+
+    @pytest.mark.parametrize('params', (
+        {},
+        {'title_ids': '1,a'},
+        {'title_ids': ','.join(['1'] * 51)},
+        {'title_ids': '1', 'per_title': 0},
+        {'title_ids': '1', 'per_title': 21},
+        {'title_ids': '²'},
+        {'title_ids': '1', 'per_title': '²'},
+        {'title_ids': '9' * 30},
+    ))
+    def test_02_invalid_params(self, client, params):
+        response = client.get(self.FEED_URL, params)
+        assert response.status_code == HTTPStatus.BAD_REQUEST, (
+            f'Проверьте, что GET-запрос к `{self.FEED_URL}` с некорректными '
+            'параметрами возвращает ответ со статусом 400.'
+        )
@@ -0,0 +1,58 @@
+import json
+from http import HTTPStatus
+
+import pytest
+
+from tests.utils import create_comments
+
+
+@pytest.mark.django_db(transaction=True)
+class Test23ReviewExport:
+
+    EXPORT_URL_TEMPLATE = '/api/v1/titles/{title_id}/reviews/export/'
+
+    def export(self, client, title_id, params=None):
+        response = client.get(
+            self.EXPORT_URL_TEMPLATE.format(title_id=title_id), params or {}
+        )
+        assert response.status_code == HTTPStatus.OK, (
+            f'Проверьте, что GET-запрос к `{self.EXPORT_URL_TEMPLATE}` '
+            'возвращает ответ со статусом 200.'
+        )
+        assert response.streaming
+        assert response['Content-Type'] == 'application/x-ndjson'
+        content = b''.join(response.streaming_content).decode()
+        return [json.loads(line) for line in content.splitlines()]
+
+    def test_01_export(self, client, admin_client, admin, user, user_client,
+                       moderator, moderator_client, monkeypatch):
+        from api import views
+
+        monkeypatch.setattr(views, 'REVIEW_EXPORT_CHUNK_SIZE', 2)
+        author_map = {
+            admin: admin_client,
+            user: user_client,
+            moderator: moderator_client
+        }
+        comments, reviews, titles = create_comments(admin_client, author_map)
+
+        lines = self.export(client, titles[0]['id'])
+        assert [line['id'] for line in lines] == [
+            review['id'] for review in reviews
+        ], (
+            f'Проверьте, что GET-запрос к `{self.EXPORT_URL_TEMPLATE}` '
+            'возвращает все отзывы произведения, по одному в строке.'
+        )
+        assert 'comments' not in lines[0]
+
+        lines = self.export(client, titles[0]['id'], {'comments': 1})
+        assert [comment['id'] for comment in lines[0]['comments']] == [
+            comment['id'] for comment in comments
+        ], (
+            f'Проверьте, что GET-запрос к `{self.EXPORT_URL_TEMPLATE}` с '
+            'параметром `comments=1` возвращает комментарии к отзывам.'
+        )
+        assert lines[1]['comments'] == []
+
+        response = client.get(self.EXPORT_URL_TEMPLATE.format(title_id=999))
+        assert response.status_code == HTTPStatus.NOT_FOUND
@@ -0,0 +1,62 @@
+from http import HTTPStatus
+
+import pytest
+
+from tests.utils import create_comments
+
+
+@pytest.mark.django_db(transaction=True)
+class Test24ReviewThread:
+
+    THREAD_URL_TEMPLATE = (
+        '/api/v1/titles/{title_id}/reviews/{review_id}/thread/'
+    )
+
+    def test_01_thread(self, client, admin_client, admin, user, user_client,
+                       moderator, moderator_client,
+                       django_assert_num_queries):
+        from reviews.models import Comment
+
+        author_map = {
+            admin: admin_client,
+            user: user_client,
+            moderator: moderator_client
+        }
+        comments, reviews, titles = create_comments(admin_client, author_map)
+        for idx in range(4):
+            Comment.objects.create(
+                review_id=reviews[0]['id'], author=user, text=f'more {idx}'
+            )
+        url = self.THREAD_URL_TEMPLATE.format(
+            title_id=titles[0]['id'], review_id=reviews[0]['id']
+        )
+
+        with django_assert_num_queries(2):
+            response = client.get(url)
+        assert response.status_code == HTTPStatus.OK, (
+            f'Проверьте, что GET-запрос к `{self.THREAD_URL_TEMPLATE}` '
+            'возвращает ответ со статусом 200.'
+        )
+        data = response.json()
+        assert data['id'] == reviews[0]['id']
+        assert data['author'] == reviews[0]['author']
+        assert len(data['comments']['results']) == 5, (
+            f'Проверьте, что ответ на GET-запрос к '
+            f'`{self.THREAD_URL_TEMPLATE}` содержит первую страницу '
+            'комментариев.'
+        )
+        assert data['comments']['results'][0]['text'] == 'more 3'
+
+        next_page = client.get(data['comments']['next'])
+        assert next_page.status_code == HTTPStatus.OK, (
+            'Проверьте, что ссылка `next` в комментариях ведёт на '
+            'следующую страницу списка комментариев.'
+        )
+        assert [comment['id'] for comment in next_page.json()['results']] == [
+            comment['id'] for comment in reversed(comments[:2])
+        ]
+
+        response = client.get(self.THREAD_URL_TEMPLATE.format(
+            title_id=titles[1]['id'], review_id=reviews[0]['id']
+        ))
+        assert response.status_code == HTTPStatus.NOT_FOUND
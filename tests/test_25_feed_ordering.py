@@ -0,0 +1,46 @@
+import pytest
+
+from tests.utils import create_comments
+
+
+@pytest.mark.django_db(transaction=True)
+class Test25FeedOrdering:
+
+    REVIEWS_URL_TEMPLATE = '/api/v1/titles/{title_id}/reviews/'
+    COMMENTS_URL_TEMPLATE = (
+        '/api/v1/titles/{title_id}/reviews/{review_id}/comments/'
+    )
+
+    def test_01_newest_first(self, client, admin_client, admin, user,
+                             user_client, moderator, moderator_client):
+        author_map = {
+            admin: admin_client,
+            user: user_client,
+            moderator: moderator_client
+        }
+        comments, reviews, titles = create_comments(admin_client, author_map)
+        for url, objects in (
+            (self.REVIEWS_URL_TEMPLATE, reviews),
+            (self.COMMENTS_URL_TEMPLATE, comments),
+        ):
+            response = client.get(url.format(
+                title_id=titles[0]['id'], review_id=reviews[0]['id']
+            ))
+            result = [obj['id'] for obj in response.json()['results']]
+            assert result == [obj['id'] for obj in reversed(objects)], (
+                f'Проверьте, что GET-запрос к `{url}` возвращает объекты '
+                'от новых к старым.'
+            )
+
+    def test_02_feed_uses_index(self):
+        from reviews.models import Comment, Review
+
+        for queryset, index in (
+            (Review.objects.filter(title_id=1), 'review_feed_idx'),
+            (Comment.objects.filter(review_id=1), 'comment_feed_idx'),
+        ):
+            plan = queryset[:5].explain()
+            assert index in plan and 'TEMP B-TREE' not in plan, (
+                f'Проверьте, что лента `{queryset.model.__name__}` читается '
+                f'по индексу `{index}` без сортировки.'
+            )
@@ -0,0 +1,38 @@
+from http import HTTPStatus
+
+import pytest
+
+from tests.utils import create_reviews, create_single_comment
+
+
+@pytest.mark.django_db(transaction=True)
+class Test26CommentParent:
+
+    COMMENTS_URL_TEMPLATE = (
+        '/api/v1/titles/{title_id}/reviews/{review_id}/comments/'
+    )
+
+    def test_01_comment_parent_lookup(self, client, admin_client, admin,
+                                      user, user_client,
+                                      django_assert_max_num_queries):
+        reviews, titles = create_reviews(
+            admin_client, {admin: admin_client, user: user_client}
+        )
+
+        # Пользователь, отзыв, BEGIN, INSERT комментария и UPDATE счётчика.
+        with django_assert_max_num_queries(5):
+            create_single_comment(
+                user_client, titles[0]['id'], reviews[0]['id'], 'text'
+            )
+
+        url = self.COMMENTS_URL_TEMPLATE.format(
+            title_id=titles[1]['id'], review_id=reviews[0]['id']
+        )
+        response = client.get(url)
+        assert response.status_code == HTTPStatus.NOT_FOUND, (
+            f'Проверьте, что GET-запрос к `{self.COMMENTS_URL_TEMPLATE}` '
+            'возвращает ответ со статусом 404, если отзыв относится к '
+            'другому произведению.'
+        )
+        response = user_client.post(url, data={'text': 'text'})
+        assert response.status_code == HTTPStatus.NOT_FOUND
@@ -0,0 +1,70 @@
+from http import HTTPStatus
+
+import pytest
+from django.core.management import call_command
+
+from tests.utils import create_single_review, create_titles
+
+
+@pytest.mark.django_db(transaction=True)
+class Test27BufferedRating:
+
+    TITLE_DETAIL_URL_TEMPLATE = '/api/v1/titles/{title_id}/'
+    REVIEW_DETAIL_URL_TEMPLATE = (
+        '/api/v1/titles/{title_id}/reviews/{review_id}/'
+    )
+
+    def get_rating(self, client, title_id):
+        response = client.get(
+            self.TITLE_DETAIL_URL_TEMPLATE.format(title_id=title_id)
+        )
+        assert response.status_code == HTTPStatus.OK
+        return response.json()['rating']
+
+    def test_01_rating_is_flushed_in_batches(self, client, admin_client,
+                                             user_client, moderator_client,
+                                             settings):
+        from reviews.models import DirtyTitle
+
+        settings.RATING_BUFFERED = True
+        titles, _, _ = create_titles(admin_client)
+        title_id = titles[0]['id']
+        assert self.get_rating(client, title_id) is None
+
+        review = create_single_review(user_client, title_id, 'text', 4).json()
+        create_single_review(moderator_client, title_id, 'text', 8)
+        assert self.get_rating(client, title_id) is None, (
+            'Проверьте, что в буферизованном режиме отзыв не пересчитывает '
+            'рейтинг сразу.'
+        )
+        assert DirtyTitle.objects.filter(title_id=title_id).count() == 2, (
+            'Проверьте, что каждый отзыв оставляет отметку о пересчёте.'
+        )
+
+        call_command('flush_ratings', once=True)
+        assert not DirtyTitle.objects.exists(), (
+            'Проверьте, что `flush_ratings` удаляет обработанные отметки.'
+        )
+        assert self.get_rating(client, title_id) == 6, (
+            'Проверьте, что `flush_ratings` пересчитывает рейтинг и '
+            'сбрасывает кэш ответов о произведениях.'
+        )
+
+        user_client.patch(
+            self.REVIEW_DETAIL_URL_TEMPLATE.format(
+                title_id=title_id, review_id=review['id']
+            ),
+            data={'text': 'new text'},
+        )
+        assert not DirtyTitle.objects.exists(), (
+            'Проверьте, что правка отзыва без смены оценки не требует '
+            'пересчёта рейтинга.'
+        )
+
+        user_client.delete(
+            self.REVIEW_DETAIL_URL_TEMPLATE.format(
+                title_id=title_id, review_id=review['id']
+            )
+        )
+        call_command('flush_ratings', once=True, batch_size=1)
+        assert self.get_rating(client, title_id) == 8
@@ -0,0 +1,100 @@
+from datetime import timedelta
+from unittest import mock
+
+import pytest
+from django.core import mail
+from django.core.management import call_command
+from django.utils import timezone
+
+
+@pytest.mark.django_db(transaction=True)
+class Test28MailQueue:
+
+    URL_SIGNUP = '/api/v1/auth/signup/'
+
+    def test_01_signup_queues_mail(self, client):
+        from user.models import QueuedEmail
+
+        valid_data = {'email': 'valid@yamdb.fake', 'username': 'valid'}
+        response = client.post(self.URL_SIGNUP, data=valid_data)
+        assert response.json() == valid_data
+        assert not mail.outbox, (
+            f'Проверьте, что `{self.URL_SIGNUP}` не отправляет письмо во '
+            'время запроса.'
+        )
+        assert QueuedEmail.objects.filter(
+            recipient=valid_data['email']
+        ).exists(), (
+            f'Проверьте, что `{self.URL_SIGNUP}` сохраняет письмо с кодом '
+            'подтверждения в очередь.'
+        )
+
+        call_command('send_queued_mail', once=True)
+        assert [message.to for message in mail.outbox] == [
+            [valid_data['email']]
+        ]
+        assert not QueuedEmail.objects.exists(), (
+            'Проверьте, что отправленные письма удаляются из очереди.'
+        )
+
+    def test_02_failed_mail_is_retried_with_backoff(self, settings):
+        from user.mail import queue_mail, send_queued_mail
+        from user.models import QueuedEmail
+
+        settings.EMAIL_QUEUE_MAX_ATTEMPTS = 2
+        queue_mail('YaMDB', 'text', 'valid@yamdb.fake')
+        with mock.patch(
+            'django.core.mail.backends.locmem.EmailBackend.send_messages',
+            side_effect=ConnectionError,
+        ):
+            assert send_queued_mail() == 1
+            email = QueuedEmail.objects.get()
+            assert email.attempts == 1
+            assert email.next_attempt_at > timezone.now(), (
+                'Проверьте, что после ошибки отправка откладывается.'
+            )
+            assert send_queued_mail() == 0
+
+            QueuedEmail.objects.update(next_attempt_at=timezone.now())
+            send_queued_mail()
+            email = QueuedEmail.objects.get()
+            assert email.attempts == 2
+            assert email.next_attempt_at is None, (
+                'Проверьте, что после EMAIL_QUEUE_MAX_ATTEMPTS ошибок '
+                'письмо больше не отправляется.'
+            )
+
+        QueuedEmail.objects.update(
+            next_attempt_at=timezone.now() - timedelta(seconds=1)
+        )
+        send_queued_mail()
+        assert len(mail.outbox) == 1
+
+    def test_03_batch_reuses_connection(self, settings):
+        from django.core.mail import get_connection
+
+        from user.mail import queue_mail, send_queued_mail
+        from user.models import QueuedEmail
+
+        settings.EMAIL_QUEUE_BATCH_SIZE = 2
+        for index in range(3):
+            queue_mail('YaMDB', 'text', f'user{index}@yamdb.fake')
+        with mock.patch(
+            'user.mail.get_connection', wraps=get_connection
+        ) as connection_factory:
+            assert send_queued_mail() == 2
+        assert connection_factory.call_count == 1, (
+            'Проверьте, что пачка писем отправляется через одно соединение.'
+        )
+        assert len(mail.outbox) == 2
+        assert QueuedEmail.objects.count() == 1
+
+        with mock.patch(
+            'django.core.mail.backends.locmem.EmailBackend.open',
+            side_effect=ConnectionError,
+        ):
+            assert send_queued_mail() == 1
+        assert QueuedEmail.objects.get().attempts == 1, (
+            'Проверьте, что при ошибке соединения письма пачки '
+            'откладываются.'
+        )
@@ -0,0 +1,110 @@
+from http import HTTPStatus
+
+import pytest
+from django.contrib.auth.tokens import default_token_generator
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+
+@pytest.mark.django_db(transaction=True)
+class Test29StatelessJWT:
+
+    URL_TOKEN = '/api/v1/auth/token/'
+    URL_CATEGORIES = '/api/v1/categories/'
+    URL_ME = '/api/v1/users/me/'
+    URL_USER_TEMPLATE = '/api/v1/users/{username}/'
+
+    def get_client(self, client, user):
+        response = client.post(self.URL_TOKEN, data={
+            'username': user.username,
+            'confirmation_code': default_token_generator.make_token(user),
+        })
+        assert response.status_code == HTTPStatus.OK
+        token_client = APIClient()
+        token_client.credentials(
+            HTTP_AUTHORIZATION=f'Bearer {response.json()["token"]}'
+        )
+        return token_client
+
+    def test_01_permissions_without_user_query(self, client, admin,
+                                               settings):
+        settings.JWT_STATELESS = True
+        admin_client = self.get_client(client, admin)
+
+        with CaptureQueriesContext(connection) as context:
+            response = admin_client.post(
+                self.URL_CATEGORIES, data={'name': 'Фильм', 'slug': 'film'}
+            )
+        assert response.status_code == HTTPStatus.CREATED
+        assert not [
+            query for query in context.captured_queries
+            if 'user_user' in query['sql']
+        ], (
+            'Проверьте, что при JWT_STATELESS права администратора '
+            'проверяются по токену без запроса к таблице пользователей.'
+        )
+
+        response = admin_client.get(self.URL_ME)
+        assert response.json()['email'] == admin.email, (
+            f'Проверьте, что `{self.URL_ME}` возвращает данные из БД, '
+            'а не из токена.'
+        )
+
+    def test_02_role_change_revokes_token(self, client, admin_client,
+                                          moderator, user, settings):
+        settings.JWT_STATELESS = True
+        moderator_client = self.get_client(client, moderator)
+        user_client = self.get_client(client, user)
+
+        user_client.patch(self.URL_ME, data={'bio': 'new bio'})
+        response = user_client.get(self.URL_ME)
+        assert response.status_code == HTTPStatus.OK, (
+            'Проверьте, что правка профиля без смены роли не отзывает токен.'
+        )
+
+        response = admin_client.patch(
+            self.URL_USER_TEMPLATE.format(username=moderator.username),
+            data={'role': 'user'},
+        )
+        assert response.status_code == HTTPStatus.OK
+        response = moderator_client.get(self.URL_ME)
+        assert response.status_code == HTTPStatus.UNAUTHORIZED, (
+            'Проверьте, что после смены роли через '
+            f'`{self.URL_USER_TEMPLATE}` старый токен не принимается.'
+        )
+        moderator.refresh_from_db()
+        response = self.get_client(client, moderator).get(self.URL_ME)
+        assert response.json()['role'] == 'user'
+
+        admin_client.delete(
+            self.URL_USER_TEMPLATE.format(username=user.username)
+        )
+        response = user_client.get(self.URL_ME)
+        assert response.status_code == HTTPStatus.UNAUTHORIZED, (
+            'Проверьте, что токен удалённого пользователя не принимается.'
+        )
+
+    def test_03_revocation_survives_cache_eviction(self, client, admin,
+                                                   user, settings):
+        from django.core.cache import cache
+
+        settings.JWT_STATELESS = True
+        admin_client = self.get_client(client, admin)
+        user_client = self.get_client(client, user)
+
+        cache.clear()
+        response = user_client.get(self.URL_ME)
+        assert response.status_code == HTTPStatus.OK, (
+            'Проверьте, что после вытеснения из кэша действительный токен '
+            'проверяется по БД и принимается.'
+        )
+
+        admin.role = 'user'
+        admin.save()
+        cache.clear()
+        response = admin_client.get('/api/v1/users/')
+        assert response.status_code == HTTPStatus.UNAUTHORIZED, (
+            'Проверьте, что отозванный токен не начинает снова приниматься '
+            'после вытеснения записи из кэша.'
+        )
@@ -0,0 +1,76 @@
+from http import HTTPStatus
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+
+def user_queries(context):
+    return [
+        query for query in context.captured_queries
+        if 'FROM "user_user"' in query['sql']
+    ]
+
+
+@pytest.mark.django_db(transaction=True)
+class Test30UserCache:
+
+    URL_ME = '/api/v1/users/me/'
+    URL_USER_TEMPLATE = '/api/v1/users/{username}/'
+    URL_STATS = '/api/v1/auth/user-cache/'
+
+    def test_01_user_is_cached(self, admin_client, user_client):
+        user_client.get(self.URL_ME)
+        with CaptureQueriesContext(connection) as context:
+            response = user_client.get(self.URL_ME)
+        assert response.status_code == HTTPStatus.OK
+        assert not user_queries(context), (
+            'Проверьте, что повторный запрос с тем же токеном не загружает '
+            'пользователя из БД.'
+        )
+
+        response = admin_client.get(self.URL_STATS)
+        assert response.status_code == HTTPStatus.OK
+        stats = response.json()
+        assert stats['hits'] == 1 and stats['misses'] == 2, (
+            f'Проверьте, что `{self.URL_STATS}` показывает попадания и '
+            'промахи кэша пользователей.'
+        )
+        assert stats['hit_rate'] == pytest.approx(1 / 3)
+
+    def test_02_stats_for_admin_only(self, user_client):
+        response = user_client.get(self.URL_STATS)
+        assert response.status_code == HTTPStatus.FORBIDDEN
+
+    def test_03_user_changes_invalidate_cache(self, admin_client,
+                                              moderator, moderator_client):
+        moderator_client.get(self.URL_ME)
+        admin_client.patch(
+            self.URL_USER_TEMPLATE.format(username=moderator.username),
+            data={'role': 'user'},
+        )
+        response = moderator_client.get(self.URL_ME)
+        assert response.json()['role'] == 'user', (
+            'Проверьте, что смена роли сбрасывает пользователя в кэше.'
+        )
+
+        moderator_client.patch(self.URL_ME, data={'bio': 'new bio'})
+        response = moderator_client.get(self.URL_ME)
+        assert response.json()['bio'] == 'new bio'
+
+        admin_client.delete(
+            self.URL_USER_TEMPLATE.format(username=moderator.username)
+        )
+        response = moderator_client.get(self.URL_ME)
+        assert response.status_code == HTTPStatus.UNAUTHORIZED, (
+            'Проверьте, что удалённый пользователь не остаётся в кэше.'
+        )
+
+    def test_04_entries_expire(self, user_client, settings):
+        settings.USER_CACHE_TTL = 0
+        user_client.get(self.URL_ME)
+        with CaptureQueriesContext(connection) as context:
+            user_client.get(self.URL_ME)
+        assert user_queries(context), (
+            'Проверьте, что запись кэша живёт не дольше USER_CACHE_TTL.'
+        )
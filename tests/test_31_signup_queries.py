@@ -0,0 +1,38 @@
+from http import HTTPStatus
+
+import pytest
+
+
+@pytest.mark.django_db(transaction=True)
+class Test31SignupQueries:
+
+    URL_SIGNUP = '/api/v1/auth/signup/'
+
+    def test_01_signup_resolves_user_in_one_lookup(
+            self, client, django_user_model, django_assert_num_queries):
+        valid_data = {'email': 'valid@yamdb.fake', 'username': 'valid'}
+
+        # Поиск, BEGIN, вставка пользователя и письма в очередь.
+        with django_assert_num_queries(4):
+            response = client.post(self.URL_SIGNUP, data=valid_data)
+        assert response.status_code == HTTPStatus.OK
+
+        # Повторный запрос: поиск и письмо в очередь, без повторной выборки.
+        with django_assert_num_queries(2):
+            response = client.post(self.URL_SIGNUP, data=valid_data)
+        assert response.json() == valid_data, (
+            f'Проверьте, что повторный POST-запрос к `{self.URL_SIGNUP}` '
+            'с той же парой возвращает данные пользователя.'
+        )
+
+        for conflict_data in (
+            {'email': 'other@yamdb.fake', 'username': 'valid'},
+            {'email': 'valid@yamdb.fake', 'username': 'other'},
+        ):
+            with django_assert_num_queries(1):
+                response = client.post(self.URL_SIGNUP, data=conflict_data)
+            assert response.status_code == HTTPStatus.BAD_REQUEST, (
+                f'Проверьте, что POST-запрос к `{self.URL_SIGNUP}` с занятым '
+                '`username` или `email` возвращает ответ со статусом 400.'
+            )
+        assert django_user_model.objects.count() == 1